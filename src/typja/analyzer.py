@@ -1,13 +1,22 @@
+import hashlib
+import os
+import re
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Literal
+from functools import cache
+from pathlib import Path
+from typing import Any, Literal
 
 from jinja2 import Environment, nodes
 from jinja2.exceptions import TemplateError
 from jinja2.visitor import NodeVisitor
 
-from typja.constants import PYTHON_BUILTINS, TYPING_TYPES
+from typja.constants import BUILTIN_OR_TYPING
 from typja.exceptions import TypjaValidationError
-from typja.parser import CommentParser
+from typja.helpers import POOL_FALLBACK_ERRORS, read_template
+from typja.parser import CommentParser, TypeParser
 from typja.parser.ast import (
     FilterDeclaration,
     FromImportStatement,
@@ -18,10 +27,10 @@ from typja.parser.ast import (
     VariableDeclaration,
 )
 from typja.registry import TypeRegistry
-from typja.resolver import TypeResolver
+from typja.resolver import ResolvedType, TypeResolver
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationIssue:
     """
     Represents a validation issue found in a template
@@ -55,11 +64,29 @@ class ValidationIssue:
         return result
 
 
+# Jinja counts line numbers on the same newline sequences
+_NEWLINE_RE = re.compile(r"\r\n|\r|\n")
+
+
+@cache
+def _default_environment() -> Environment:
+    # Shared by every analyzer created without an explicit environment, so checking many
+    # templates doesn't build a new environment per template
+    return Environment(autoescape=True, extensions=["jinja2.ext.do"])
+
+
 class TemplateAnalyzer:
     """
     Analyze and validate Jinja templates with type annotations
     """
 
+    # Maximum number of parsed templates kept in the per-analyzer caches
+    CACHE_SIZE = 512
+
+    # Minimum number of files before analyze_files pays for a process pool. Starting a spawn pool takes about
+    # as long as analyzing 65 small templates sequentially, so smaller batches are faster without one
+    PARALLEL_THRESHOLD = 96
+
     def __init__(
         self,
         registry: TypeRegistry,
@@ -67,12 +94,13 @@ class TemplateAnalyzer:
         resolver: TypeResolver | None = None,
     ):
         self.registry = registry
-        self.jinja_env = jinja_env or Environment(autoescape=True, extensions=["jinja2.ext.do"])
+        self.jinja_env = jinja_env or _default_environment()
 
         if self.jinja_env.autoescape is False:
             self.jinja_env.autoescape = True
 
         self.comment_parser = CommentParser()
+        self.type_parser = TypeParser()
         self.resolver = resolver
 
         self.variables: dict[str, VariableDeclaration] = {}
@@ -80,22 +108,43 @@ class TemplateAnalyzer:
         self.macros: dict[str, MacroDeclaration] = {}
         self.ignored_lines: set[int] = set()
         self.issues: list[ValidationIssue] = []
-        self._content_lines: list[str] = []
+        self._content = ""
+        self._line_starts: list[int] | None = None
+
+        self._filter_arities: dict[str, int | None] = {}
+        self._type_exists_cache: dict[str, bool] = {}
+        self._attribute_cache: dict[tuple[str, str], tuple[bool, str | None]] = {}
+        self._col_cache: dict[tuple[int, str], tuple[int, int | None]] = {}
+
+        self._parsed_type_cache: dict[str, TypeAnnotation | None] = {}
+        self._ast_cache: OrderedDict[tuple[str, bytes], nodes.Template] = OrderedDict()
+        self._comment_cache: OrderedDict[tuple[str, bytes], list[TypjaComment]] = OrderedDict()
+
+        self._declaration_handlers: dict[type, Callable[[Any, str], None]] = {
+            ImportStatement: self._process_import,
+            FromImportStatement: self._process_from_import,
+            VariableDeclaration: self._process_variable,
+            FilterDeclaration: self._process_filter,
+            MacroDeclaration: self._process_macro,
+        }
 
     def analyze_template(self, content: str, filename: str = "<unknown>") -> list[ValidationIssue]:
 
-        self.registry.clear_imports()
-        self._content_lines = content.splitlines()
+        cache_key = self._reset_state(content, filename)
 
         try:
-            comments = self.comment_parser.parse_template(content, filename)
-
-            for comment in comments:
-                self._process_comment(comment, filename)
+            comments = self._process_declarations(content, filename, cache_key)
 
             try:
-                ast = self.jinja_env.parse(content, filename=filename)
-                self._validate_ast(ast, filename)
+                ast = self._cache_get(self._ast_cache, cache_key)
+                if ast is None:
+                    ast = self.jinja_env.parse(content, filename=filename)
+                    self._cache_put(self._ast_cache, cache_key, ast)
+
+                # Templates without typja comments haven't opted in to type checking, so only
+                # their Jinja syntax is checked
+                if comments:
+                    self._validate_ast(ast, filename)
             except TemplateError as e:
                 self.issues.append(
                     ValidationIssue(
@@ -107,99 +156,326 @@ class TemplateAnalyzer:
                 )
 
         except TypjaValidationError as e:
-            self.issues.append(
-                ValidationIssue(
-                    severity="error",
-                    message=str(e),
-                    filename=filename,
-                    line=getattr(e, "line", 0),
-                    col=getattr(e, "col", 0),
-                )
-            )
+            self._add_validation_error(e, filename)
+
+        return self.issues
+
+    def analyze_declarations_only(self, content: str, filename: str = "<unknown>") -> list[ValidationIssue]:
+        """
+        Process a template's typja comments without parsing or validating its Jinja AST
+
+        The declared variables, filters and macros are left on the analyzer for the caller to inspect.
+
+        Args:
+            content (str): The template source
+            filename (str): The filename for error reporting
+
+        Returns:
+            list[ValidationIssue]: Issues found in the typja comments
+        """
+
+        cache_key = self._reset_state(content, filename)
+
+        try:
+            self._process_declarations(content, filename, cache_key)
+        except TypjaValidationError as e:
+            self._add_validation_error(e, filename)
 
         return self.issues
 
+    def _reset_state(self, content: str, filename: str) -> tuple[str, bytes]:
+        """
+        Clear per-template state before an analysis
+
+        Args:
+            content (str): The template source
+            filename (str): The template filename
+
+        Returns:
+            tuple[str, bytes]: The key for the parse caches
+        """
+
+        self.registry.clear_imports()
+        self.variables.clear()
+        self.filters.clear()
+        self._filter_arities.clear()
+        self._type_exists_cache.clear()
+        self._attribute_cache.clear()
+        self._col_cache.clear()
+        self.macros.clear()
+        self.ignored_lines.clear()
+        self.issues = []
+        self._content = content
+        self._line_starts = None
+
+        return (filename, hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest())
+
+    def _process_declarations(self, content: str, filename: str, cache_key: tuple[str, bytes]) -> list[TypjaComment]:
+        """
+        Parse the template's typja comments, through the cache, and register their declarations
+
+        Args:
+            content (str): The template source
+            filename (str): The template filename
+            cache_key (tuple[str, bytes]): The key for the parse caches
+
+        Returns:
+            list[TypjaComment]: The parsed typja comments
+        """
+
+        comments = self._cache_get(self._comment_cache, cache_key)
+        if comments is None:
+            comments = self.comment_parser.parse_template(content, filename)
+            self._cache_put(self._comment_cache, cache_key, comments)
+
+        for comment in comments:
+            self._process_comment(comment, filename)
+
+        return comments
+
+    def _add_validation_error(self, error: TypjaValidationError, filename: str) -> None:
+        self.issues.append(
+            ValidationIssue(
+                severity="error",
+                message=str(error),
+                filename=filename,
+                line=error.line,
+                col=error.col,
+            )
+        )
+
+    def analyze_file(self, path: Path) -> list[ValidationIssue]:
+        """
+        Read and analyze a template file
+
+        Args:
+            path (Path): Path to the template file
+
+        Returns:
+            list[ValidationIssue]: Issues found in the template
+        """
+
+        return self.analyze_template(read_template(path), str(path))
+
+    def analyze_files(self, paths: list[Path]) -> dict[Path, list[ValidationIssue]]:
+        """
+        Analyze many template files, spreading the work over a process pool
+
+        Each worker builds its own analyzer from this analyzer's registry, resolver and jinja environment.
+        Small batches, setups that can't be sent to worker processes, and files left without a result when the
+        pool breaks are analyzed sequentially.
+
+        Args:
+            paths (list[Path]): Paths to the template files
+
+        Returns:
+            dict[Path, list[ValidationIssue]]: Issues found in each template
+        """
+
+        results: dict[Path, list[ValidationIssue]] = {}
+        max_workers = min(len(paths), os.cpu_count() or 1)
+
+        if len(paths) >= self.PARALLEL_THRESHOLD and max_workers > 1:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_worker,
+                    initargs=(self.registry, self.jinja_env, self.resolver),
+                ) as executor:
+                    for path, issues in zip(paths, executor.map(_analyze_in_worker, paths), strict=True):
+                        results[path] = issues
+            except POOL_FALLBACK_ERRORS:
+                # The pool broke or the work couldn't be sent to it, the files without results are analyzed here,
+                # which also surfaces any genuine per-file error
+                pass
+
+        for path in paths:
+            if path not in results:
+                results[path] = self.analyze_file(path)
+
+        return results
+
+    def _cache_get(self, cache: OrderedDict, key: tuple[str, bytes]) -> Any:
+        """
+        Look up a cached parse result and mark it as most recently used
+
+        Args:
+            cache (OrderedDict): The cache to look up
+            key (tuple[str, bytes]): The (filename, content digest) key
+
+        Returns:
+            Any: The cached value or None if not present
+        """
+
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+
+        return value
+
+    def _cache_put(self, cache: OrderedDict, key: tuple[str, bytes], value: Any) -> None:
+        """
+        Store a parse result, evicting the least recently used entry when full
+
+        Args:
+            cache (OrderedDict): The cache to store into
+            key (tuple[str, bytes]): The (filename, content digest) key
+            value (Any): The parse result to store
+        """
+
+        cache[key] = value
+        if len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+
     def _process_comment(self, comment: TypjaComment, filename: str) -> None:
 
         if comment.kind == "ignore":
             self.ignored_lines.add(comment.line)
             return
 
+        handlers = self._declaration_handlers
         for decl in comment.declarations:
-            if isinstance(decl, ImportStatement):
-                self.registry.import_module(decl.module)
-
-            elif isinstance(decl, FromImportStatement):
-                self.registry.import_from_module(decl.module, decl.names)
-
-            elif isinstance(decl, VariableDeclaration):
-                if self.resolver:
-                    self._validate_type_declaration(decl, filename)
-                else:
-                    try:
-                        self.registry.resolve_type(decl.type_annotation)
-                    except TypjaValidationError as e:
-                        self.issues.append(
-                            ValidationIssue(
-                                severity="error",
-                                message=str(e),
-                                filename=filename,
-                                line=decl.line,
-                                col=decl.col,
-                            )
-                        )
+            handler = handlers.get(type(decl))
+            if handler is not None:
+                handler(decl, filename)
 
-                self.variables[decl.name] = decl
+    def _process_import(self, decl: ImportStatement, filename: str) -> None:
+        """
+        Import a module declared with `typja:import`
 
-            elif isinstance(decl, FilterDeclaration):
-                if decl.type_annotation.name != "Callable":
-                    self.issues.append(
-                        ValidationIssue(
-                            severity="error",
-                            message=f"Filter '{decl.name}' must have Callable type",
-                            filename=filename,
-                            line=decl.line,
-                            col=decl.col,
-                        )
+        Args:
+            decl (ImportStatement): The import statement
+            filename (str): The filename for error reporting
+        """
+
+        self.registry.import_module(decl.module)
+
+    def _process_from_import(self, decl: FromImportStatement, filename: str) -> None:
+        """
+        Import names declared with `typja:from ... import ...`
+
+        Args:
+            decl (FromImportStatement): The from-import statement
+            filename (str): The filename for error reporting
+        """
+
+        self.registry.import_from_module(decl.module, decl.names)
+
+    def _process_variable(self, decl: VariableDeclaration, filename: str) -> None:
+        """
+        Validate and register a variable declaration
+
+        Args:
+            decl (VariableDeclaration): The variable declaration
+            filename (str): The filename for error reporting
+        """
+
+        if self.resolver:
+            self._validate_type_declaration(decl, filename)
+        else:
+            try:
+                self.registry.resolve_type(decl.type_annotation)
+            except TypjaValidationError as e:
+                self.issues.append(
+                    ValidationIssue(
+                        severity="error",
+                        message=str(e),
+                        filename=filename,
+                        line=decl.line,
+                        col=decl.col,
                     )
+                )
 
-                self.filters[decl.name] = decl
-
-            elif isinstance(decl, MacroDeclaration):
-
-                for param_name, param_type, _, _ in decl.params:
-                    try:
-                        self.registry.resolve_type(param_type)
-                    except TypjaValidationError as e:
-                        self.issues.append(
-                            ValidationIssue(
-                                severity="error",
-                                message=f"Invalid type for parameter '{param_name}': {str(e)}",
-                                filename=filename,
-                                line=decl.line,
-                                col=decl.col,
-                            )
-                        )
+        self.variables[decl.name] = decl
 
-                try:
-                    self.registry.resolve_type(decl.return_type)
-                except TypjaValidationError as e:
-                    self.issues.append(
-                        ValidationIssue(
-                            severity="error",
-                            message=f"Invalid return type: {str(e)}",
-                            filename=filename,
-                            line=decl.line,
-                            col=decl.col,
-                        )
+    def _process_filter(self, decl: FilterDeclaration, filename: str) -> None:
+        """
+        Validate and register a filter declaration
+
+        Args:
+            decl (FilterDeclaration): The filter declaration
+            filename (str): The filename for error reporting
+        """
+
+        if decl.type_annotation.name != "Callable":
+            self.issues.append(
+                ValidationIssue(
+                    severity="error",
+                    message=f"Filter '{decl.name}' must have Callable type",
+                    filename=filename,
+                    line=decl.line,
+                    col=decl.col,
+                )
+            )
+
+        self.filters[decl.name] = decl
+        self._filter_arities[decl.name] = self._get_filter_arity(decl)
+
+    def _process_macro(self, decl: MacroDeclaration, filename: str) -> None:
+        """
+        Validate and register a macro declaration
+
+        Args:
+            decl (MacroDeclaration): The macro declaration
+            filename (str): The filename for error reporting
+        """
+
+        for param_name, param_type, _, _ in decl.params:
+            try:
+                self.registry.resolve_type(param_type)
+            except TypjaValidationError as e:
+                self.issues.append(
+                    ValidationIssue(
+                        severity="error",
+                        message=f"Invalid type for parameter '{param_name}': {str(e)}",
+                        filename=filename,
+                        line=decl.line,
+                        col=decl.col,
                     )
+                )
 
-                self.macros[decl.name] = decl
+        try:
+            self.registry.resolve_type(decl.return_type)
+        except TypjaValidationError as e:
+            self.issues.append(
+                ValidationIssue(
+                    severity="error",
+                    message=f"Invalid return type: {str(e)}",
+                    filename=filename,
+                    line=decl.line,
+                    col=decl.col,
+                )
+            )
+
+        self.macros[decl.name] = decl
+
+    def _get_filter_arity(self, decl: FilterDeclaration) -> int | None:
+        """
+        Compute the number of arguments a declared filter expects
+
+        Args:
+            decl (FilterDeclaration): The filter declaration
+
+        Returns:
+            int | None: The expected argument count or None if the signature can't be checked
+        """
+
+        type_annotation = decl.type_annotation
+
+        if type_annotation.name != "Callable" or not type_annotation.args or len(type_annotation.args) < 2:
+            return None
+
+        arg_types_annotation = type_annotation.args[0]
+        if arg_types_annotation.args:
+            return len(arg_types_annotation.args)
+
+        return 1
 
     def _validate_ast(self, ast: nodes.Template, filename: str) -> None:
 
         visitor = ValidationVisitor(self, filename)
         visitor.visit(ast)
+        self.issues.extend(visitor.pending)
 
     def add_issue(
         self,
@@ -237,14 +513,18 @@ class TemplateAnalyzer:
             return
 
         type_annotation = decl.type_annotation
+        conflicts = self.resolver.get_type_conflicts()
 
-        if type_annotation.is_union and type_annotation.union_types:
-            for union_type in type_annotation.union_types:
-                self._validate_single_type(union_type, decl, filename)
-        else:
-            self._validate_single_type(type_annotation, decl, filename)
+        for member in type_annotation.flat_types:
+            self._validate_single_type(member, decl, filename, conflicts)
 
-    def _validate_single_type(self, type_annotation: TypeAnnotation, decl: VariableDeclaration, filename: str) -> None:
+    def _validate_single_type(
+        self,
+        type_annotation: TypeAnnotation,
+        decl: VariableDeclaration,
+        filename: str,
+        conflicts: dict[str, list[ResolvedType]],
+    ) -> None:
         """
         Validate a single type annotation
 
@@ -252,24 +532,14 @@ class TemplateAnalyzer:
             type_annotation (TypeAnnotation): The type annotation to validate
             decl (VariableDeclaration): The variable declaration
             filename (str): The filename for error reporting
+            conflicts (dict[str, list[ResolvedType]]): The resolver's type conflicts, fetched once per declaration
         """
 
-        if not self.resolver:
-            return
-
         type_name = type_annotation.name
 
-        if type_name in PYTHON_BUILTINS or type_name in TYPING_TYPES:
-            return
-
-        base_type_name = type_name
-        if type_annotation.module:
-            base_type_name = type_name
-
-        if type_name in self.registry._imported_names:
+        if type_name in BUILTIN_OR_TYPING or type_name in self.registry._imported_names:
             return
 
-        conflicts = self.resolver.get_type_conflicts()
         if type_name in conflicts and not type_annotation.module:
             conflicting_types = conflicts[type_name]
             qualified_names = [f"{rt.qualified_name}" for rt in conflicting_types]
@@ -283,7 +553,7 @@ class TemplateAnalyzer:
             )
             return
 
-        if not self.resolver.validate_type_exists(base_type_name):
+        if not self._type_exists(type_name):
             self.add_issue(
                 severity="error",
                 message=f"Type '{type_name}' not found in configured paths",
@@ -295,7 +565,69 @@ class TemplateAnalyzer:
 
         if type_annotation.args:
             for arg in type_annotation.args:
-                self._validate_single_type(arg, decl, filename)
+                self._validate_single_type(arg, decl, filename, conflicts)
+
+    def _type_exists(self, type_name: str) -> bool:
+        """
+        Check whether a type exists in the resolver, memoized for the current analysis
+
+        Args:
+            type_name (str): Name of the type (can be qualified)
+
+        Returns:
+            bool: True if the type exists, False otherwise
+        """
+
+        exists = self._type_exists_cache.get(type_name)
+        if exists is None:
+            exists = self._type_exists_cache[type_name] = bool(
+                self.resolver and self.resolver.validate_type_exists(type_name)
+            )
+
+        return exists
+
+    def _validate_attribute(self, type_name: str, attribute: str) -> tuple[bool, str | None]:
+        """
+        Validate an attribute access through the resolver, memoized for the current analysis
+
+        Args:
+            type_name (str): Name of the type (can be qualified)
+            attribute (str): Name of the attribute
+
+        Returns:
+            tuple[bool, str | None]: (is_valid, error_message)
+        """
+
+        key = (type_name, attribute)
+        result = self._attribute_cache.get(key)
+        if result is None:
+            if not self.resolver:
+                return True, None
+            result = self._attribute_cache[key] = self.resolver.validate_attribute(type_name, attribute)
+
+        return result
+
+    def _parse_attribute_type(self, type_str: str) -> TypeAnnotation | None:
+        """
+        Parse an attribute's type annotation string, memoized for the lifetime of the analyzer
+
+        Args:
+            type_str (str): The type annotation string reported by the resolver
+
+        Returns:
+            TypeAnnotation | None: The parsed type annotation or None if it can't be parsed
+        """
+
+        if type_str in self._parsed_type_cache:
+            return self._parsed_type_cache[type_str]
+
+        try:
+            type_annotation: TypeAnnotation | None = self.type_parser.parse_type(type_str, 0, 0)
+        except Exception:
+            type_annotation = None
+
+        self._parsed_type_cache[type_str] = type_annotation
+        return type_annotation
 
     def _get_column_position(self, line_no: int, text: str) -> tuple[int, int | None]:
         """
@@ -309,17 +641,44 @@ class TemplateAnalyzer:
             tuple[int, int | None]: (start_col, end_col) or (0, None) if not found
         """
 
-        if line_no <= 0 or line_no > len(self._content_lines):
-            return 0, None
+        key = (line_no, text)
+        position = self._col_cache.get(key)
+        if position is not None:
+            return position
+
+        position = (0, None)
 
-        line_content = self._content_lines[line_no - 1]
-        start_pos = line_content.find(text)
+        # Line offsets are only needed once an issue is reported, so they're computed on first use
+        line_starts = self._line_starts
+        if line_starts is None:
+            line_starts = [0]
+            line_starts.extend(match.end() for match in _NEWLINE_RE.finditer(self._content))
+            self._line_starts = line_starts
 
-        if start_pos == -1:
-            return 0, None
+        if 0 < line_no <= len(line_starts):
+            line_start = line_starts[line_no - 1]
+            line_end = line_starts[line_no] if line_no < len(line_starts) else len(self._content)
 
-        end_pos = start_pos + len(text)
-        return start_pos, end_pos
+            start_pos = self._content.find(text, line_start, line_end)
+            if start_pos != -1:
+                start_col = start_pos - line_start
+                position = (start_col, start_col + len(text))
+
+        self._col_cache[key] = position
+        return position
+
+
+_worker_analyzer: TemplateAnalyzer | None = None
+
+
+def _init_worker(registry: TypeRegistry, jinja_env: Environment, resolver: TypeResolver | None) -> None:
+    global _worker_analyzer
+    _worker_analyzer = TemplateAnalyzer(registry, jinja_env=jinja_env, resolver=resolver)
+
+
+def _analyze_in_worker(path: Path) -> list[ValidationIssue]:
+    assert _worker_analyzer is not None
+    return _worker_analyzer.analyze_file(path)
 
 
 class ValidationVisitor(NodeVisitor):
@@ -328,106 +687,185 @@ class ValidationVisitor(NodeVisitor):
         self.analyzer = analyzer
         self.filename = filename
         self.loop_vars: dict[str, TypeAnnotation] = {}
+        self.pending: list[ValidationIssue] = []
+        self._has_ignored = bool(analyzer.ignored_lines)
+        self._type_cache: dict[int, TypeAnnotation | None] = {}
+        self._type_inferrers: dict[type[nodes.Node], Callable[[Any], TypeAnnotation | None]] = {
+            nodes.Name: self._infer_name_type,
+            nodes.Getattr: self._infer_getattr_type,
+            nodes.Getitem: self._infer_getitem_type,
+        }
+
+        self._dispatch: dict[type[nodes.Node], Callable[[Any], None]] = {
+            nodes.Name: self.visit_Name,
+            nodes.Filter: self.visit_Filter,
+            nodes.Getattr: self.visit_Getattr,
+            nodes.Getitem: self.visit_Getitem,
+            nodes.For: self.visit_For,
+            nodes.Call: self.visit_Call,
+        }
+
+    def visit(self, node: nodes.Node, *args: Any, **kwargs: Any) -> Any:
+        """
+        Visit a node using the precomputed dispatch table
+
+        Args:
+            node (nodes.Node): The AST node to visit
+
+        Returns:
+            Any: The result of the visitor method, if any
+        """
+
+        visitor = self._dispatch.get(type(node))
+        if visitor is not None:
+            return visitor(node)
+
+        return self.generic_visit(node, *args, **kwargs)
+
+    def generic_visit(self, node: nodes.Node, *args: Any, **kwargs: Any) -> None:
+        """
+        Visit all children of a node, walking nodes without a visitor method iteratively
+
+        Args:
+            node (nodes.Node): The AST node whose children to visit
+        """
+
+        dispatch = self._dispatch
+
+        stack = list(node.iter_child_nodes())
+        stack.reverse()
+
+        while stack:
+            child = stack.pop()
+            visitor = dispatch.get(type(child))
+
+            if visitor is not None:
+                visitor(child)
+            else:
+                children = list(child.iter_child_nodes())
+                children.reverse()
+                stack.extend(children)
 
     def visit_Name(self, node: nodes.Name) -> None:
+        if node.ctx != "load":
+            return
+
+        analyzer = self.analyzer
+        var_name = node.name
+
+        if var_name in analyzer.variables or var_name in self.loop_vars:
+            return
+
         # skip checks for lines marked with `{# typja: ignore #}`
-        if node.lineno in self.analyzer.ignored_lines:
+        if self._has_ignored and node.lineno in analyzer.ignored_lines:
             return
 
-        if node.ctx == "load":
-            var_name = node.name
-
-            if var_name in self.loop_vars:
-                return
-
-            if var_name not in self.analyzer.variables:
-                col_start, col_end = self.analyzer._get_column_position(node.lineno, var_name)
-                self.analyzer.add_issue(
-                    severity="warning",
-                    message=f"Variable '{var_name}' is not declared",
-                    filename=self.filename,
-                    line=node.lineno,
-                    col=col_start,
-                    end_col=col_end,
-                    hint=f"Add declaration: {{# typja:var {var_name}: <type> #}}",
-                )
+        col_start, col_end = analyzer._get_column_position(node.lineno, var_name)
+        self.pending.append(
+            ValidationIssue(
+                severity="warning",
+                message=f"Variable '{var_name}' is not declared",
+                filename=self.filename,
+                line=node.lineno,
+                col=col_start,
+                end_col=col_end,
+                hint=f"Add declaration: {{# typja:var {var_name}: <type> #}}",
+            )
+        )
 
     def visit_Filter(self, node: nodes.Filter) -> None:
+        analyzer = self.analyzer
+
         # skip checks for lines marked with `{# typja: ignore #}`
-        if node.lineno in self.analyzer.ignored_lines:
+        if self._has_ignored and node.lineno in analyzer.ignored_lines:
             return
 
         filter_name = node.name
+        expected_count = analyzer._filter_arities.get(filter_name)
 
-        if filter_name in self.analyzer.filters:
-            filter_decl = self.analyzer.filters[filter_name]
-
-            if filter_decl.type_annotation.name == "Callable" and filter_decl.type_annotation.args:
-                if len(filter_decl.type_annotation.args) >= 2:
-                    arg_types_annotation = filter_decl.type_annotation.args[0]
-
-                    expected_count = 1
-                    if arg_types_annotation.args:
-                        expected_count = len(arg_types_annotation.args)
-
-                    actual_count = 1
-                    if node.args:
-                        actual_count += len(node.args)
-                    if node.kwargs:
-                        actual_count += len(node.kwargs)
-                    if node.dyn_args:
-                        actual_count = -1  # I can't validate with dynamic args for now, so I just skip it
-                    if node.dyn_kwargs:
-                        actual_count = -1  # I can't validate with dynamic kwargs for now, so I just skip it
-
-                    if actual_count != -1 and actual_count != expected_count:
-                        self.analyzer.add_issue(
-                            severity="error",
-                            message=f"Filter '{filter_name}' expects {expected_count} argument(s) but got {actual_count}",
-                            filename=self.filename,
-                            line=node.lineno,
-                        )
+        # I can't validate with dynamic args and kwargs for now, so I just skip them
+        if expected_count is not None and node.dyn_args is None and node.dyn_kwargs is None:
+            actual_count = 1 + len(node.args) + len(node.kwargs)
+
+            if actual_count != expected_count:
+                self.pending.append(
+                    ValidationIssue(
+                        severity="error",
+                        message=f"Filter '{filter_name}' expects {expected_count} argument(s) but got {actual_count}",
+                        filename=self.filename,
+                        line=node.lineno,
+                    )
+                )
 
         self.generic_visit(node)
 
     def visit_Getattr(self, node: nodes.Getattr) -> None:
         # skip checks for lines marked with `{# typja: ignore #}`
-        if node.lineno in self.analyzer.ignored_lines:
+        if self._has_ignored and node.lineno in self.analyzer.ignored_lines:
             return
 
+        self._check_attr_access(node, node.attr, is_getitem=False)
+        self.generic_visit(node)
+
+    def _check_attr_access(self, node: nodes.Getattr | nodes.Getitem, attr_name: str, is_getitem: bool) -> None:
+        """
+        Validate that the type of the accessed node has the given attribute
+
+        Args:
+            node (nodes.Getattr | nodes.Getitem): The attribute or item access node
+            attr_name (str): The attribute name, or the string key for item access
+            is_getitem (bool): Whether the access is dictionary-style (`user['name']`)
+        """
+
+        analyzer = self.analyzer
         base_type_annotation = self._resolve_node_type(node.node)
 
-        if base_type_annotation and self.analyzer.resolver:
-            base_type_name = self._get_base_type_name(base_type_annotation)
+        if not base_type_annotation or not analyzer.resolver:
+            return
+
+        base_type_name = self._get_base_type_name(base_type_annotation)
 
-            # Special handling for explicitly imported types - use the registry to get the correct type
-            if base_type_annotation.name in self.analyzer.registry._imported_names and not base_type_annotation.module:
-                imported_type_def = self.analyzer.registry._imported_names[base_type_annotation.name]
-                if imported_type_def and imported_type_def.module:
-                    base_type_name = f"{imported_type_def.module}.{base_type_annotation.name}"
+        # Special handling for explicitly imported types - use the registry to get the correct type
+        if (
+            not is_getitem
+            and base_type_annotation.name in analyzer.registry._imported_names
+            and not base_type_annotation.module
+        ):
+            imported_type_def = analyzer.registry._imported_names[base_type_annotation.name]
+            if imported_type_def and imported_type_def.module:
+                base_type_name = f"{imported_type_def.module}.{base_type_annotation.name}"
 
-            if base_type_name:
-                is_valid, error_msg = self.analyzer.resolver.validate_attribute(base_type_name, node.attr)
+        if not base_type_name:
+            return
 
-                if not is_valid:
-                    # Get column position for the attribute
-                    col_start, col_end = self.analyzer._get_column_position(node.lineno, node.attr)
+        is_valid, error_msg = analyzer._validate_attribute(base_type_name, attr_name)
+        if is_valid:
+            return
 
-                    self.analyzer.add_issue(
-                        severity="error",
-                        message=f"Type '{base_type_name}' has no attribute '{node.attr}'",
-                        filename=self.filename,
-                        line=node.lineno,
-                        col=col_start,
-                        end_col=col_end,
-                        hint=f"Check the definition of '{base_type_name}' for available attributes",
-                    )
+        col_start, col_end = analyzer._get_column_position(node.lineno, attr_name)
 
-        self.generic_visit(node)
+        if is_getitem:
+            message = error_msg or f"Type '{base_type_name}' has no attribute '{attr_name}'"
+            hint = f"Dictionary-style access user['{attr_name}'] requires the attribute to exist"
+        else:
+            message = f"Type '{base_type_name}' has no attribute '{attr_name}'"
+            hint = f"Check the definition of '{base_type_name}' for available attributes"
+
+        self.pending.append(
+            ValidationIssue(
+                severity="error",
+                message=message,
+                filename=self.filename,
+                line=node.lineno,
+                col=col_start,
+                end_col=col_end,
+                hint=hint,
+            )
+        )
 
     def _resolve_node_type(self, node: nodes.Node) -> TypeAnnotation | None:
         """
-        Recursively resolve the type of a node (Name, Getattr, or Getitem)
+        Resolve the type of a node, memoized per node for the current visit
 
         Args:
             node (nodes.Node): The AST node to resolve
@@ -436,64 +874,75 @@ class ValidationVisitor(NodeVisitor):
             TypeAnnotation | None: The resolved type annotation or None
         """
 
-        if isinstance(node, nodes.Name):
-            var_name = node.name
+        key = id(node)
+        if key in self._type_cache:
+            return self._type_cache[key]
 
-            if var_name in self.analyzer.variables:
-                return self.analyzer.variables[var_name].type_annotation
-            elif var_name in self.loop_vars:
-                return self.loop_vars[var_name]
+        result = self._infer_node_type(node)
+        self._type_cache[key] = result
+        return result
 
-            return None
+    def _infer_node_type(self, node: nodes.Node) -> TypeAnnotation | None:
+        """
+        Recursively resolve the type of a node (Name, Getattr, or Getitem)
+
+        Args:
+            node (nodes.Node): The AST node to resolve
 
-        elif isinstance(node, nodes.Getattr):
-            base_type = self._resolve_node_type(node.node)
+        Returns:
+            TypeAnnotation | None: The resolved type annotation or None
+        """
 
-            if not base_type or not self.analyzer.resolver:
-                return None
+        inferrer = self._type_inferrers.get(type(node))
+        if inferrer is None:
+            return None
 
-            base_type_name = self._get_base_type_name(base_type)
-            if not base_type_name:
-                return None
+        return inferrer(node)
 
-            attr_type_str = self.analyzer.resolver.get_attribute_type(base_type_name, node.attr)
+    def _infer_name_type(self, node: nodes.Name) -> TypeAnnotation | None:
+        var_name = node.name
 
-            if attr_type_str:
-                try:
-                    from typja.parser.type import TypeParser
+        if var_name in self.analyzer.variables:
+            return self.analyzer.variables[var_name].type_annotation
+        elif var_name in self.loop_vars:
+            return self.loop_vars[var_name]
 
-                    type_parser = TypeParser()
-                    return type_parser.parse_type(attr_type_str, node.lineno, 0)
-                except Exception:
-                    return None
+        return None
 
+    def _infer_getattr_type(self, node: nodes.Getattr) -> TypeAnnotation | None:
+        base_type = self._resolve_node_type(node.node)
+
+        if not base_type or not self.analyzer.resolver:
             return None
 
-        elif isinstance(node, nodes.Getitem):
-            base_type = self._resolve_node_type(node.node)
+        base_type_name = self._get_base_type_name(base_type)
+        if not base_type_name:
+            return None
 
-            if not base_type:
-                return None
+        attr_type_str = self.analyzer.resolver.get_attribute_type(base_type_name, node.attr)
 
-            if isinstance(node.arg, nodes.Const) and isinstance(node.arg.value, str):
-                if self.analyzer.resolver:
-                    base_type_name = self._get_base_type_name(base_type)
-                    if base_type_name:
-                        attr_type_str = self.analyzer.resolver.get_attribute_type(base_type_name, node.arg.value)
-                        if attr_type_str:
-                            try:
-                                from typja.parser.type import TypeParser
+        if attr_type_str:
+            return self.analyzer._parse_attribute_type(attr_type_str)
 
-                                type_parser = TypeParser()
-                                return type_parser.parse_type(attr_type_str, node.lineno, 0)
-                            except Exception:
-                                return None
+        return None
 
-            if base_type.args and len(base_type.args) > 0:
-                return base_type.args[0]
+    def _infer_getitem_type(self, node: nodes.Getitem) -> TypeAnnotation | None:
+        base_type = self._resolve_node_type(node.node)
 
+        if not base_type:
             return None
 
+        if isinstance(node.arg, nodes.Const) and isinstance(node.arg.value, str):
+            if self.analyzer.resolver:
+                base_type_name = self._get_base_type_name(base_type)
+                if base_type_name:
+                    attr_type_str = self.analyzer.resolver.get_attribute_type(base_type_name, node.arg.value)
+                    if attr_type_str:
+                        return self.analyzer._parse_attribute_type(attr_type_str)
+
+        if base_type.args and len(base_type.args) > 0:
+            return base_type.args[0]
+
         return None
 
     def _get_base_type_name(self, type_annotation: TypeAnnotation) -> str | None:
@@ -510,10 +959,10 @@ class ValidationVisitor(NodeVisitor):
         if type_annotation.args and len(type_annotation.args) > 0:
             return type_annotation.args[0].name
 
-        if type_annotation.is_union and type_annotation.union_types:
-            for union_type in type_annotation.union_types:
-                if union_type.name != "None":
-                    return self._get_base_type_name(union_type)
+        if type_annotation.is_union:
+            member = next((t for t in type_annotation.flat_types if t.name != "None"), None)
+            if member is not None:
+                return self._get_base_type_name(member)
 
         # Handle qualified names - return the full qualified name
         if type_annotation.module:
@@ -521,34 +970,13 @@ class ValidationVisitor(NodeVisitor):
 
         return type_annotation.name
 
-    def _original_visit_Getattr(self, node: nodes.Getattr) -> None:
-        if isinstance(node.node, nodes.Name):
-            var_name = node.node.name
-            attr_name = node.attr
-
-            if var_name in self.analyzer.variables:
-                var_decl = self.analyzer.variables[var_name]
-
-                try:
-                    type_def = self.analyzer.registry.resolve_type(var_decl.type_annotation)
-
-                    if type_def:
-                        if not type_def.has_field(attr_name) and not type_def.has_method(attr_name):
-                            self.analyzer.add_issue(
-                                severity="error",
-                                message=f"Type '{type_def.name}' has no attribute '{attr_name}'",
-                                filename=self.filename,
-                                line=node.lineno,
-                            )
-                except TypjaValidationError:
-                    pass
-
-        self.generic_visit(node)
-
     def visit_For(self, node: nodes.For) -> None:
         loop_var_name = None
         loop_var_type = None
 
+        # The iterable is evaluated outside the loop scope, so visit it before binding the loop variable
+        self.visit(node.iter)
+
         # Extract the loop variable name
         if isinstance(node.target, nodes.Name):
             loop_var_name = node.target.name
@@ -566,6 +994,9 @@ class ValidationVisitor(NodeVisitor):
             if loop_var_type:
                 self.loop_vars[loop_var_name] = loop_var_type
 
+        if node.test:
+            self.visit(node.test)
+
         for child in node.body:
             self.visit(child)
 
@@ -578,84 +1009,68 @@ class ValidationVisitor(NodeVisitor):
 
     def visit_Getitem(self, node: nodes.Getitem) -> None:
         # skip checks for lines marked with `{# typja: ignore #}`
-        if node.lineno in self.analyzer.ignored_lines:
+        if self._has_ignored and node.lineno in self.analyzer.ignored_lines:
             return
 
-        base_type = self._resolve_node_type(node.node)
-
-        if base_type and self.analyzer.resolver:
-            if isinstance(node.arg, nodes.Const) and isinstance(node.arg.value, str):
-                base_type_name = self._get_base_type_name(base_type)
-
-                if base_type_name:
-                    is_valid, error_msg = self.analyzer.resolver.validate_attribute(base_type_name, node.arg.value)
-
-                    if not is_valid:
-                        col_start, col_end = self.analyzer._get_column_position(node.lineno, node.arg.value)
-                        self.analyzer.add_issue(
-                            severity="error",
-                            message=error_msg or f"Type '{base_type_name}' has no attribute '{node.arg.value}'",
-                            filename=self.filename,
-                            line=node.lineno,
-                            col=col_start,
-                            end_col=col_end,
-                            hint=f"Dictionary-style access user['{node.arg.value}'] requires the attribute to exist",
-                        )
+        if isinstance(node.arg, nodes.Const) and isinstance(node.arg.value, str):
+            self._check_attr_access(node, node.arg.value, is_getitem=True)
 
         self.generic_visit(node)
 
     def visit_Call(self, node: nodes.Call) -> None:
+        analyzer = self.analyzer
+
         # skip checks for lines marked with `{# typja: ignore #}`
-        if node.lineno in self.analyzer.ignored_lines:
+        if self._has_ignored and node.lineno in analyzer.ignored_lines:
             return
 
         if isinstance(node.node, nodes.Name):
             func_name = node.node.name
 
-            if func_name in self.analyzer.macros:
-                macro_decl = self.analyzer.macros[func_name]
-
-                required_params = [p for p in macro_decl.params if not p[2]]
-                total_params = len(macro_decl.params)
-                min_params = len(required_params)
-                max_params = total_params
-
-                actual_positional = len(node.args) if node.args else 0
-                actual_keyword = len(node.kwargs) if node.kwargs else 0
-                actual_total = actual_positional + actual_keyword
-
+            if func_name in analyzer.macros:
                 # I can't validate with dynamic args and kwargs for now, so just skip it
-                if node.dyn_args or node.dyn_kwargs:
+                if node.dyn_args is not None or node.dyn_kwargs is not None:
                     self.generic_visit(node)
                     return
 
+                macro_decl = analyzer.macros[func_name]
+
+                min_params = len(macro_decl.required_params)
+                max_params = len(macro_decl.params)
+                actual_total = len(node.args) + len(node.kwargs)
+
                 if actual_total < min_params:
-                    self.analyzer.add_issue(
-                        severity="error",
-                        message=f"Macro '{func_name}' requires at least {min_params} argument(s) but got {actual_total}",
-                        filename=self.filename,
-                        line=node.lineno,
-                        hint=f"Required parameters: {', '.join(p[0] for p in required_params)}",
+                    self.pending.append(
+                        ValidationIssue(
+                            severity="error",
+                            message=f"Macro '{func_name}' requires at least {min_params} argument(s) but got {actual_total}",
+                            filename=self.filename,
+                            line=node.lineno,
+                            hint=f"Required parameters: {', '.join(macro_decl.required_params)}",
+                        )
                     )
 
                 elif actual_total > max_params:
-                    self.analyzer.add_issue(
-                        severity="error",
-                        message=f"Macro '{func_name}' accepts at most {max_params} argument(s) but got {actual_total}",
-                        filename=self.filename,
-                        line=node.lineno,
+                    self.pending.append(
+                        ValidationIssue(
+                            severity="error",
+                            message=f"Macro '{func_name}' accepts at most {max_params} argument(s) but got {actual_total}",
+                            filename=self.filename,
+                            line=node.lineno,
+                        )
                     )
 
                 if node.kwargs:
-                    param_names = {p[0] for p in macro_decl.params}
                     for kwarg in node.kwargs:
-                        if kwarg.key not in param_names:
-                            self.analyzer.add_issue(
-                                severity="error",
-                                message=f"Macro '{func_name}' has no parameter named '{kwarg.key}'",
-                                filename=self.filename,
-                                line=node.lineno,
-                                hint=f"Valid parameters: {', '.join(param_names)}",
+                        if kwarg.key not in macro_decl.param_names:
+                            self.pending.append(
+                                ValidationIssue(
+                                    severity="error",
+                                    message=f"Macro '{func_name}' has no parameter named '{kwarg.key}'",
+                                    filename=self.filename,
+                                    line=node.lineno,
+                                    hint=f"Valid parameters: {', '.join(p[0] for p in macro_decl.params)}",
+                                )
                             )
 
         self.generic_visit(node)
@@ -1,14 +1,22 @@
+import hashlib
 import importlib
+import os
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 import typer
 from jinja2 import Environment
 from rich.console import Console
 
 from typja.analyzer import TemplateAnalyzer, ValidationIssue
+from typja.config import TypjaConfig
 from typja.config.loader import ConfigLoader
 from typja.exceptions import TypjaConfigError
-from typja.helpers import find_templates
+from typja.helpers import POOL_FALLBACK_ERRORS, find_templates_multi, read_template
 from typja.linter import Linter
 from typja.registry import TypeRegistry
 from typja.reporter import Reporter
@@ -17,6 +25,358 @@ from typja.resolver import TypeResolver
 console = Console()
 
 
+class Checker:
+    """
+    Holds the type registry, resolver, jinja environment and linter for a project, so templates can be
+    checked repeatedly (e.g. in watch mode) without rebuilding them
+    """
+
+    # Maximum number of per-template results kept between checks
+    RESULTS_CACHE_SIZE = 1024
+
+    # Number of threads reading template files
+    READ_WORKERS = 8
+
+    def __init__(self, config: TypjaConfig, jinja_env: Environment | None = None):
+        self.config = config
+        self.jinja_env = jinja_env
+        self.linter = Linter()
+        self.lint_config = {
+            "prefer_pep604_unions": config.linting.prefer_pep604_unions,
+            "union_style": config.linting.union_style,
+            "warn_unused_imports": config.linting.warn_unused_imports,
+            "fix_union_syntax": config.linting.fix_union_syntax,
+        }
+
+        self.registry = TypeRegistry()
+        self.resolver = TypeResolver(
+            config.root_path,
+            exclude_patterns=config.environment.exclude_patterns,
+        )
+
+        self.analyzer = TemplateAnalyzer(self.registry, jinja_env=jinja_env, resolver=self.resolver)
+
+        # (path, content digest) -> (issues, lint issues), results depend on the resolved types so
+        # reload_types clears it
+        self._results_cache: OrderedDict[
+            tuple[str, bytes], tuple[tuple[ValidationIssue, ...], tuple[ValidationIssue, ...]]
+        ] = OrderedDict()
+
+    def reload_types(self) -> None:
+        """
+        Re-resolve the configured type paths into a fresh registry
+        """
+
+        self._results_cache.clear()
+        self.registry = TypeRegistry()
+        self.resolver = TypeResolver(
+            self.config.root_path,
+            exclude_patterns=self.config.environment.exclude_patterns,
+        )
+
+        # analyze_template resets its per-template state, so one analyzer serves every template
+        self.analyzer = TemplateAnalyzer(self.registry, jinja_env=self.jinja_env, resolver=self.resolver)
+
+        type_paths = self.config.get_type_paths()
+        if type_paths:
+            console.print(f"[blue]Resolving types from {len(type_paths)} path(s)...[/blue]")
+            self.resolver.resolve_paths(type_paths)
+            self.resolver.populate_registry(self.registry)
+            console.print(f"[green]✓[/green] Found {len(self.resolver.resolved_types)} type(s)\n")
+
+    def check_paths(self, paths: Iterable[Path], fix: bool = False) -> list[ValidationIssue]:
+        """
+        Analyze and lint the given templates
+
+        Args:
+            paths (Iterable[Path]): The template files to check
+            fix (bool): Whether to write automatic fixes back to the templates
+
+        Returns:
+            list[ValidationIssue]: All issues found in the templates
+        """
+
+        paths = list(paths)
+        templates: list[tuple[Path, str]] = []
+
+        # Reads release the GIL, so overlapping them hides per-file IO latency
+        with ThreadPoolExecutor(max_workers=min(self.READ_WORKERS, len(paths) or 1)) as executor:
+            for template_path, content in zip(paths, executor.map(_read_or_error, paths), strict=True):
+                if isinstance(content, Exception):
+                    console.print(f"[red]Error analyzing {template_path}:[/red] {str(content)}")
+                else:
+                    templates.append((template_path, content))
+
+        all_issues: list[ValidationIssue] = []
+
+        for (template_path, content), result in zip(templates, self._check_contents(templates), strict=True):
+            if result is None:
+                continue
+
+            issues, lint_issues = result
+
+            try:
+                # Only lint issues carry fixes, so templates without a fixable one are never rewritten
+                fixable = [issue for issue in lint_issues if self.linter.is_fixable(issue)] if fix else []
+                if fixable:
+                    fixed_content = self.linter.auto_fix(content, fixable)
+                    if fixed_content != content:
+                        template_path.write_text(fixed_content, encoding="utf-8")
+                        console.print(f"[green]✓[/green] Fixed {template_path.relative_to(self.config.root_path)}")
+            except Exception as e:
+                console.print(f"[red]Error analyzing {template_path}:[/red] {str(e)}")
+
+            all_issues.extend(issues)
+
+        return all_issues
+
+    def _check_contents(
+        self, templates: list[tuple[Path, str]]
+    ) -> list[tuple[list[ValidationIssue], list[ValidationIssue]] | None]:
+        """
+        Analyze and lint template contents, reusing previous results for unchanged templates
+
+        Templates that aren't cached are spread over a process pool when there are enough of them. Small
+        batches, setups that can't be sent to worker processes, and templates left without a result when the
+        pool breaks are checked sequentially.
+
+        Args:
+            templates (list[tuple[Path, str]]): The template paths and their contents
+
+        Returns:
+            list[tuple[list[ValidationIssue], list[ValidationIssue]] | None]: All issues and the lint issues
+                among them for each template, in order, or None where the template couldn't be checked
+        """
+
+        keys = [
+            (str(template_path), hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest())
+            for template_path, content in templates
+        ]
+        results: list[tuple[tuple[ValidationIssue, ...], tuple[ValidationIssue, ...]] | None] = []
+
+        for key in keys:
+            cached = self._results_cache.get(key)
+            if cached is not None:
+                self._results_cache.move_to_end(key)
+            results.append(cached)
+
+        misses = [i for i, result in enumerate(results) if result is None]
+        max_workers = min(len(misses), os.cpu_count() or 1)
+
+        if len(misses) >= TemplateAnalyzer.PARALLEL_THRESHOLD and max_workers > 1:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_check_worker,
+                    initargs=(self.registry, self.jinja_env, self.resolver, self.lint_config),
+                ) as executor:
+                    tasks = [(str(templates[i][0]), templates[i][1]) for i in misses]
+                    for i, checked in zip(misses, executor.map(_check_in_worker, tasks, chunksize=8), strict=True):
+                        results[i] = checked
+            except POOL_FALLBACK_ERRORS:
+                # The pool broke or the work couldn't be sent to it, results already received are kept and the
+                # remaining templates are checked sequentially, which also reports any genuine per-template error
+                pass
+
+        for i in misses:
+            if results[i] is not None:
+                continue
+
+            template_path, content = templates[i]
+
+            try:
+                results[i] = _check_content(self.analyzer, self.linter, self.lint_config, str(template_path), content)
+            except Exception as e:
+                console.print(f"[red]Error analyzing {template_path}:[/red] {str(e)}")
+
+        for i in misses:
+            result = results[i]
+            if result is not None:
+                self._results_cache[keys[i]] = result
+                if len(self._results_cache) > self.RESULTS_CACHE_SIZE:
+                    self._results_cache.popitem(last=False)
+
+        return [None if result is None else (list(result[0]), list(result[1])) for result in results]
+
+
+def _read_or_error(path: Path) -> str | Exception:
+    try:
+        return read_template(path)
+    except Exception as e:
+        return e
+
+
+def _check_content(
+    analyzer: TemplateAnalyzer,
+    linter: Linter,
+    lint_config: dict[str, Any],
+    filename: str,
+    content: str,
+) -> tuple[tuple[ValidationIssue, ...], tuple[ValidationIssue, ...]]:
+    """
+    Analyze and lint one template's content
+
+    Args:
+        analyzer (TemplateAnalyzer): The analyzer to use
+        linter (Linter): The linter to use
+        lint_config (dict[str, Any]): The lint rule settings
+        filename (str): The template filename for issue reporting
+        content (str): The template content
+
+    Returns:
+        tuple[tuple[ValidationIssue, ...], tuple[ValidationIssue, ...]]: All issues, and the lint issues among them
+    """
+
+    issues = analyzer.analyze_template(content, filename)
+    lint_issues = linter.lint_template(content, filename, lint_config)
+
+    return (*issues, *lint_issues), tuple(lint_issues)
+
+
+_worker_state: tuple[TemplateAnalyzer, Linter, dict[str, Any]] | None = None
+
+
+def _init_check_worker(
+    registry: TypeRegistry,
+    jinja_env: Environment | None,
+    resolver: TypeResolver,
+    lint_config: dict[str, Any],
+) -> None:
+    global _worker_state
+    _worker_state = (TemplateAnalyzer(registry, jinja_env=jinja_env, resolver=resolver), Linter(), lint_config)
+
+
+def _check_in_worker(task: tuple[str, str]) -> tuple[tuple[ValidationIssue, ...], tuple[ValidationIssue, ...]]:
+    assert _worker_state is not None
+    analyzer, linter, lint_config = _worker_state
+    return _check_content(analyzer, linter, lint_config, *task)
+
+
+@lru_cache(maxsize=8)
+def _resolve_jinja_env(spec: str) -> Environment:
+    """
+    Import the jinja environment named by a `module.path:attribute` spec, memoized per spec
+
+    Args:
+        spec (str): The jinja_env value from typja.toml
+
+    Returns:
+        Environment: The configured jinja environment
+
+    Raises:
+        TypjaConfigError: If the spec is malformed or doesn't name a jinja Environment
+    """
+
+    if ":" not in spec:
+        raise TypjaConfigError("Invalid jinja_env format in typja.toml. Use 'module.path:attribute'.")
+
+    module_path, attr_name = spec.split(":", 1)
+    module_path = module_path.strip()
+    attr_name = attr_name.strip()
+
+    if not module_path or not attr_name:
+        raise TypjaConfigError("Invalid jinja_env format in typja.toml. Use 'module.path:attribute'.")
+
+    try:
+        module = importlib.import_module(module_path)
+    except Exception as e:
+        raise TypjaConfigError(
+            f"Failed to import jinja environment in '{module_path}' specified in typja.toml: {str(e)}"
+        ) from e
+
+    if not hasattr(module, attr_name):
+        raise TypjaConfigError(
+            f"For jinja environment specified in typja.toml, '{module_path}' has no attribute '{attr_name}'."
+        )
+
+    candidate = getattr(module, attr_name)
+    if not isinstance(candidate, Environment):
+        raise TypjaConfigError("jinja_env must be a Jinja2 Environment instance.")
+
+    return candidate
+
+
+def build_checker(config: TypjaConfig) -> Checker:
+    """
+    Import the configured jinja environment and resolve the configured type paths
+
+    Args:
+        config (TypjaConfig): The project configuration
+
+    Returns:
+        Checker: A checker ready to check templates
+
+    Raises:
+        typer.Exit: If the configured jinja environment can't be loaded
+    """
+
+    jinja_env: Environment | None = None
+
+    if config.environment.jinja_env:
+        try:
+            jinja_env = _resolve_jinja_env(config.environment.jinja_env)
+        except TypjaConfigError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1) from e
+
+    checker = Checker(config, jinja_env)
+    checker.reload_types()
+    return checker
+
+
+def find_all_templates(config: TypjaConfig) -> list[Path]:
+    """
+    Find the templates in all configured template directories
+
+    Args:
+        config (TypjaConfig): The project configuration
+
+    Returns:
+        list[Path]: The template file paths
+    """
+
+    return find_templates_multi(
+        config.template_dir_paths,
+        config.environment.include_patterns,
+        config.environment.exclude_patterns,
+    )
+
+
+def report_results(config: TypjaConfig, issues: list[ValidationIssue], total_files: int) -> int:
+    """
+    Report issues and a summary, and work out the resulting exit code
+
+    Args:
+        config (TypjaConfig): The project configuration
+        issues (list[ValidationIssue]): The issues to report
+        total_files (int): The number of templates checked
+
+    Returns:
+        int: 1 if the check failed, otherwise 0
+    """
+
+    reporter = Reporter(config.errors)
+    reporter.report(issues)
+
+    errors = sum(1 for issue in issues if issue.severity == "error")
+    warnings = sum(1 for issue in issues if issue.severity == "warning")
+
+    reporter.report_summary(
+        total_files=total_files,
+        total_issues=len(issues),
+        errors=errors,
+        warnings=warnings,
+    )
+
+    if errors > 0:
+        return 1
+
+    if warnings > 0 and config.project.fail_on_warning:
+        return 1
+
+    return 0
+
+
 def check(
     root: str = typer.Option(
         ".",
@@ -78,64 +438,9 @@ def check(
         if strict:
             config.project.fail_on_warning = True
 
-        registry = TypeRegistry()
-        resolver = TypeResolver(
-            config.root_path,
-            exclude_patterns=config.environment.exclude_patterns,
-        )
-
-        jinja_env: Environment | None = None
-
-        if config.environment.jinja_env:
-            if ":" not in config.environment.jinja_env:
-                console.print("[red]Error:[/red] Invalid jinja_env format in typja.toml. Use 'module.path:attribute'.")
-                raise typer.Exit(1)
-
-            module_path, attr_name = config.environment.jinja_env.split(":", 1)
-            module_path = module_path.strip()
-            attr_name = attr_name.strip()
-
-            if not module_path or not attr_name:
-                console.print("[red]Error:[/red] Invalid jinja_env format in typja.toml. Use 'module.path:attribute'.")
-                raise typer.Exit(1)
-
-            try:
-                module = importlib.import_module(module_path)
-            except Exception as e:
-                console.print(
-                    f"[red]Error:[/red] Failed to import jinja environment in '{module_path}' specified in typja.toml: {str(e)}"
-                )
-                raise typer.Exit(1) from e
-
-            if not hasattr(module, attr_name):
-                console.print(
-                    f"[red]Error:[/red] For jinja environment specified in typja.toml, '{module_path}' has no attribute '{attr_name}'."
-                )
-                raise typer.Exit(1)
-
-            candidate = getattr(module, attr_name)
-            if not isinstance(candidate, Environment):
-                console.print("[red]Error:[/red] jinja_env must be a Jinja2 Environment instance.")
-                raise typer.Exit(1)
-
-            jinja_env = candidate
+        checker = build_checker(config)
 
-        type_paths = config.get_type_paths()
-        if type_paths:
-            console.print(f"[blue]Resolving types from {len(type_paths)} path(s)...[/blue]")
-            resolver.resolve_paths(type_paths)
-            resolver.populate_registry(registry)
-            console.print(f"[green]✓[/green] Found {len(resolver.resolved_types)} type(s)\n")
-
-        templates = []
-        for template_dir in config.get_template_dirs():
-            if template_dir.exists():
-                found = find_templates(
-                    template_dir,
-                    config.environment.include_patterns,
-                    config.environment.exclude_patterns,
-                )
-                templates.extend(found)
+        templates = find_all_templates(config)
 
         if not templates:
             console.print("[yellow]No templates found to check.[/yellow]")
@@ -143,62 +448,9 @@ def check(
 
         console.print(f"[blue]Checking {len(templates)} template(s)...[/blue]\n")
 
-        all_issues: list[ValidationIssue] = []
-        linter = Linter()
-
-        for template_path in templates:
-            try:
-                content = template_path.read_text(encoding="utf-8")
-
-                analyzer = TemplateAnalyzer(
-                    registry=registry,
-                    resolver=resolver,
-                    jinja_env=jinja_env,
-                )
-
-                issues = analyzer.analyze_template(content, str(template_path))
-
-                lint_config = {
-                    "prefer_pep604_unions": config.linting.prefer_pep604_unions,
-                    "union_style": config.linting.union_style,
-                    "warn_unused_imports": config.linting.warn_unused_imports,
-                    "fix_union_syntax": config.linting.fix_union_syntax,
-                }
-                lint_issues = linter.lint_template(content, str(template_path), lint_config)
-
-                issues.extend(lint_issues)
-
-                if fix and (issues or lint_issues):
-                    fixed_content = linter.auto_fix(content, issues + lint_issues)
-                    if fixed_content != content:
-                        template_path.write_text(fixed_content, encoding="utf-8")
-                        console.print(f"[green]✓[/green] Fixed {template_path.relative_to(config.root_path)}")
-
-                all_issues.extend(issues)
-
-            except Exception as e:
-                console.print(f"[red]Error analyzing {template_path}:[/red] {str(e)}")
-
-        reporter = Reporter(config.errors)
-        reporter.report(all_issues)
-
-        errors = sum(1 for issue in all_issues if issue.severity == "error")
-        warnings = sum(1 for issue in all_issues if issue.severity == "warning")
-
-        reporter.report_summary(
-            total_files=len(templates),
-            total_issues=len(all_issues),
-            errors=errors,
-            warnings=warnings,
-        )
-
-        if errors > 0:
-            raise typer.Exit(1)
-
-        if warnings > 0 and config.project.fail_on_warning:
-            raise typer.Exit(1)
+        all_issues = checker.check_paths(templates, fix=fix)
 
-        raise typer.Exit(0)
+        raise typer.Exit(report_results(config, all_issues, len(templates)))
 
     except typer.Exit:
         raise
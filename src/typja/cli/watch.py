@@ -1,15 +1,54 @@
+import itertools
+import os
+import queue
 import time
+from collections.abc import Iterator
 from pathlib import Path
 
 import typer
 from rich.console import Console
 
+from typja.cli.check import Checker, build_checker, find_all_templates, report_results
 from typja.config.loader import ConfigLoader
 from typja.exceptions import TypjaConfigError
-from typja.helpers import find_templates
+from typja.helpers import find_templates_multi, is_template
+
+try:
+    from watchdog.observers import Observer  # type: ignore[import-not-found]
+except ImportError:  # watchdog is optional, watch mode falls back to polling without it
+    Observer = None  # type: ignore[assignment,misc]
 
 console = Console()
 
+# Seconds between polls, and how long file events must stop for before a check runs
+POLL_INTERVAL = 1.0
+EVENT_DEBOUNCE = 0.2
+
+
+class _EventCollector:
+    """
+    Watchdog event handler that queues the paths touched by file system events
+    """
+
+    def __init__(self) -> None:
+        self.paths: queue.SimpleQueue[Path] = queue.SimpleQueue()
+
+    def dispatch(self, event) -> None:
+        if event.is_directory:
+            return
+
+        for raw_path in (event.src_path, getattr(event, "dest_path", "")):
+            if raw_path:
+                self.paths.put(Path(raw_path.decode() if isinstance(raw_path, bytes) else raw_path))
+
+    def drain(self) -> list[Path]:
+        paths: list[Path] = []
+        while True:
+            try:
+                paths.append(self.paths.get_nowait())
+            except queue.Empty:
+                return paths
+
 
 def watch(
     root: str = typer.Option(
@@ -18,11 +57,17 @@ def watch(
         "-r",
         help="Root directory of the project. Defaults to current directory.",
     ),
+    poll: bool = typer.Option(
+        False,
+        "--poll",
+        help="Poll files for changes instead of using file system events.",
+    ),
 ) -> None:
     """
     Watch type paths and templates directories for changes and auto checks them for type errors and linting issues.
 
     This command watches your template files and automatically runs type checking whenever files are modified.
+    File system events are used when the optional `watchdog` package is installed, otherwise files are polled.
 
     Examples:
 
@@ -31,6 +76,9 @@ def watch(
 
         # Watch from specific project root
         typja watch --root ./my-project/
+
+        # Poll for changes, e.g. on network file systems that don't emit events
+        typja watch --poll
     """
 
     try:
@@ -51,7 +99,7 @@ def watch(
 
         config = ConfigLoader.load(config_file)
 
-        template_dirs = config.get_template_dirs()
+        template_dirs = config.template_dir_paths
         type_paths = config.get_type_paths()
 
         watch_paths: list[Path] = []
@@ -63,74 +111,170 @@ def watch(
 
         console.print("[dim]Press Ctrl+C to stop[/dim]\n")
 
-        file_mtimes: dict[Path, float] = {}
+        file_mtimes: dict[Path, int] = {}
 
         def get_all_templates() -> list[Path]:
-            templates = []
-            for watch_path in template_dirs:
-                if not watch_path.exists():
-                    continue
-                templates.extend(
-                    find_templates(
-                        watch_path,
-                        config.environment.include_patterns,
-                        config.environment.exclude_patterns,
-                    )
-                )
-            return templates
-
-        def get_all_type_files() -> list[Path]:
-            type_files: list[Path] = []
+            return find_templates_multi(
+                template_dirs,
+                config.environment.include_patterns,
+                config.environment.exclude_patterns,
+            )
+
+        def is_type_file(path: Path) -> bool:
+            if path.suffix != ".py" or "__pycache__" in path.parts:
+                return False
+            if config.environment.exclude_regex.search(path.as_posix()):
+                return False
+            return any(path == type_path or type_path in path.parents for type_path in type_paths)
+
+        def iter_type_files() -> Iterator[Path]:
+            exclude_regex = config.environment.exclude_regex
             for type_path in type_paths:
                 if not type_path.exists():
                     continue
                 if type_path.is_file() and type_path.suffix == ".py":
-                    type_files.append(type_path)
+                    yield type_path
                 elif type_path.is_dir():
                     for py_file in type_path.rglob("*.py"):
-                        if "__pycache__" not in py_file.parts and not any(
-                            py_file.match(pattern) for pattern in config.environment.exclude_patterns
-                        ):
-                            type_files.append(py_file)
-            return type_files
+                        if "__pycache__" not in py_file.parts and not exclude_regex.search(py_file.as_posix()):
+                            yield py_file
+
+        def iter_watched_files() -> Iterator[Path]:
+            # Consumed once per poll, so the files are streamed rather than collected into lists
+            return itertools.chain(get_all_templates(), iter_type_files(), (config_file,))
+
+        def is_watched_file(path: Path) -> bool:
+            if path == config_file or is_type_file(path):
+                return True
+            return any(
+                is_template(
+                    path,
+                    template_dir,
+                    config.environment.include_patterns,
+                    config.environment.exclude_patterns,
+                )
+                for template_dir in template_dirs
+            )
+
+        checker: Checker | None = None
+
+        def run_checks(changed_files: list[Path] | None) -> int:
+            nonlocal checker
 
-        def get_all_watched_files() -> list[Path]:
-            files = get_all_templates()
-            files.extend(get_all_type_files())
-            if config_file.exists():
-                files.append(config_file)
-            return files
+            # The checker keeps the resolved types between runs and is only rebuilt when its inputs change
+            if checker is None or changed_files is None or config_file in changed_files:
+                checker = None  # stays unset if the rebuild fails, so the next change retries it
+                checker = build_checker(ConfigLoader.load(config_file))
+                templates = find_all_templates(checker.config)
+            elif any(is_type_file(path) for path in changed_files):
+                checker.reload_types()
+                templates = find_all_templates(checker.config)
+            else:
+                templates = [path for path in changed_files if path.exists()]
 
-        from typja.cli.check import check as run_check
+            if not templates:
+                console.print("[yellow]No templates found to check.[/yellow]")
+                return 0
+
+            console.print(f"[blue]Checking {len(templates)} template(s)...[/blue]\n")
+
+            issues = checker.check_paths(templates)
+            return report_results(checker.config, issues, len(templates))
+
+        def check_changes(changed_files: list[Path]) -> None:
+            console.print(f"[yellow]Detected changes in {len(changed_files)} file(s)[/yellow]")
+            for file in changed_files:
+                try:
+                    console.print(f"  • {file.relative_to(root_path)}")
+                except ValueError:
+                    console.print(f"  • {file}")
+
+            console.print()
+
+            try:
+                exit_code = run_checks(changed_files)
+                if exit_code != 0:
+                    console.print(f"[red]Check failed with exit code:[/red] {exit_code}")
+            except typer.Exit as e:
+                if e.exit_code != 0:
+                    console.print(f"[red]Check failed with exit code:[/red] {e.exit_code}")
+            except Exception as e:
+                console.print(f"[red]Check failed:[/red] {str(e)}")
+
+            console.print("\n[green]✓ Watching for changes...[/green]\n")
 
         console.print("[blue]Running initial check...[/blue]\n")
         try:
-            run_check(root=str(root_path), fix=False, strict=False)
+            exit_code = run_checks(None)
+            if exit_code != 0:
+                console.print(f"\n[yellow]Warning:[/yellow] Initial check failed with exit code: {exit_code}\n")
         except typer.Exit as e:
             if e.exit_code != 0:
                 console.print(f"\n[yellow]Warning:[/yellow] Initial check failed with exit code: {e.exit_code}\n")
         except Exception as e:
             console.print(f"\n[yellow]Warning:[/yellow] Initial check failed: {str(e)}\n")
 
-        for file_path in get_all_watched_files():
-            if file_path.exists():
-                file_mtimes[file_path] = file_path.stat().st_mtime
+        if Observer is not None and not poll:
+            # Event-driven: the OS reports changes, so idle cost doesn't grow with the number of files
+            template_dirs = tuple(path.resolve() for path in template_dirs)
+            type_paths = [path.resolve() for path in type_paths]
+            config_file = config_file.resolve()
+
+            collector = _EventCollector()
+            observer = Observer()
+
+            for watch_path in [*template_dirs, *type_paths]:
+                if watch_path.is_dir():
+                    observer.schedule(collector, str(watch_path), recursive=True)
+                elif watch_path.exists():
+                    observer.schedule(collector, str(watch_path.parent), recursive=False)
+            observer.schedule(collector, str(config_file.parent), recursive=False)
+
+            observer.start()
+            console.print("\n[green]✓ Watching for changes...[/green]\n")
+
+            pending: set[Path] = set()
+
+            try:
+                while True:
+                    time.sleep(EVENT_DEBOUNCE)
+
+                    # A single save often arrives as a burst of events, so wait until they stop before checking
+                    events = collector.drain()
+                    if events:
+                        pending.update(path for path in events if is_watched_file(path))
+                        continue
+
+                    if pending:
+                        changed_files = sorted(pending)
+                        pending.clear()
+                        check_changes(changed_files)
+            finally:
+                observer.stop()
+                observer.join()
+
+        for file_path in iter_watched_files():
+            try:
+                file_mtimes[file_path] = os.stat(file_path).st_mtime_ns
+            except FileNotFoundError:
+                continue
 
         console.print("\n[green]✓ Watching for changes...[/green]\n")
 
         while True:
-            time.sleep(1)
+            time.sleep(POLL_INTERVAL)
 
             changed_files = []
-            current_files = get_all_watched_files()
+            seen: set[Path] = set()
 
-            for file_path in current_files:
-                if not file_path.exists():
-                    if file_path in file_mtimes:
-                        del file_mtimes[file_path]
+            for file_path in iter_watched_files():
+                # One stat per file, a missing file raises instead of needing a separate exists() check
+                try:
+                    current_mtime = os.stat(file_path).st_mtime_ns
+                except FileNotFoundError:
                     continue
 
-                current_mtime = file_path.stat().st_mtime
+                seen.add(file_path)
 
                 if file_path not in file_mtimes:
                     changed_files.append(file_path)
@@ -140,25 +284,13 @@ def watch(
                     changed_files.append(file_path)
                     file_mtimes[file_path] = current_mtime
 
-            if changed_files:
-                console.print(f"[yellow]Detected changes in {len(changed_files)} file(s)[/yellow]")
-                for file in changed_files:
-                    try:
-                        console.print(f"  • {file.relative_to(root_path)}")
-                    except ValueError:
-                        console.print(f"  • {file}")
-
-                console.print()
+            # Files tracked last poll but not found in this one were deleted
+            for file_path in file_mtimes.keys() - seen:
+                del file_mtimes[file_path]
+                changed_files.append(file_path)
 
-                try:
-                    run_check(root=str(root_path), fix=False, strict=False)
-                except typer.Exit as e:
-                    if e.exit_code != 0:
-                        console.print(f"[red]Check failed with exit code:[/red] {e.exit_code}")
-                except Exception as e:
-                    console.print(f"[red]Check failed:[/red] {str(e)}")
-
-                console.print("\n[green]✓ Watching for changes...[/green]\n")
+            if changed_files:
+                check_changes(changed_files)
 
     except KeyboardInterrupt as e:
         console.print("\n[blue]Stopped watching.[/blue]")
@@ -1,3 +1,4 @@
+import copy
 import sys
 from pathlib import Path
 from typing import Any
@@ -7,6 +8,11 @@ if sys.version_info < (3, 11):
 else:
     import tomllib
 
+try:
+    import rtoml  # type: ignore[import-not-found]
+except ImportError:  # rtoml is optional, the standard library parser is used without it
+    rtoml = None  # type: ignore[assignment]
+
 from typja.config.schema import (
     EnvironmentConfig,
     ErrorsConfig,
@@ -17,6 +23,9 @@ from typja.config.schema import (
 )
 from typja.exceptions import TypjaConfigError
 
+# Parsed configs keyed by resolved path, along with the (mtime_ns, size) they were parsed at
+_CONFIG_CACHE: dict[Path, tuple[int, int, TypjaConfig]] = {}
+
 
 class ConfigLoader:
     """
@@ -40,16 +49,25 @@ class ConfigLoader:
         else:
             config_path = Path(config_path)
 
-        if not config_path.exists():
-            raise TypjaConfigError(f"Configuration file not found: {config_path}")
-
         try:
-            with open(config_path, "rb") as f:
-                data = tomllib.load(f)
-        except Exception as e:
-            raise TypjaConfigError(f"Failed to parse {config_path}: {str(e)}") from e
+            stat = config_path.stat()
+        except OSError as e:
+            raise TypjaConfigError(f"Configuration file not found: {config_path}") from e
+
+        cache_key = config_path.resolve()
+        cached = _CONFIG_CACHE.get(cache_key)
 
-        return ConfigLoader.parse_config(data)
+        if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+            try:
+                data = _parse_toml(config_path)
+            except Exception as e:
+                raise TypjaConfigError(f"Failed to parse {config_path}: {str(e)}") from e
+
+            cached = (stat.st_mtime_ns, stat.st_size, ConfigLoader.parse_config(data))
+            _CONFIG_CACHE[cache_key] = cached
+
+        # Callers may adjust their config (e.g. --strict), so they never get the cached instance itself
+        return copy.deepcopy(cached[2])
 
     @staticmethod
     def find_config(start_dir: Path | None = None) -> Path:
@@ -159,3 +177,21 @@ def load_config(config_path: Path | str | None = None) -> TypjaConfig:
     """
 
     return ConfigLoader.load(config_path)
+
+
+def _parse_toml(path: Path) -> dict[str, Any]:
+    """
+    Parse a TOML file, using the native rtoml parser when it is installed
+
+    Args:
+        path (Path): The TOML file to parse
+
+    Returns:
+        dict[str, Any]: The parsed document
+    """
+
+    if rtoml is not None:
+        return rtoml.load(path)
+
+    with open(path, "rb") as f:
+        return tomllib.load(f)
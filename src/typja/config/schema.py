@@ -1,9 +1,14 @@
+import glob
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
+from typja.helpers import compile_exclude_patterns, compile_include_patterns
 
-@dataclass
+
+@dataclass(slots=True)
 class ProjectConfig:
     """
     Schema for project configuration section, defining root directory and paths to analyze
@@ -19,7 +24,7 @@ class ProjectConfig:
     fail_on_warning: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvironmentConfig:
     """
     Schema for jinja environment configuration section
@@ -46,8 +51,16 @@ class EnvironmentConfig:
         ]
     )
 
+    @property
+    def include_regex(self) -> re.Pattern[str]:
+        return compile_include_patterns(tuple(self.include_patterns))
+
+    @property
+    def exclude_regex(self) -> re.Pattern[str]:
+        return compile_exclude_patterns(tuple(self.exclude_patterns))
+
 
-@dataclass
+@dataclass(slots=True)
 class LintingConfig:
     """
     Schema for linting configuration section
@@ -82,7 +95,7 @@ class LintingConfig:
     check_missing_annotations: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class FormattingConfig:
     """
     Schema for formatting configuration section
@@ -96,7 +109,7 @@ class FormattingConfig:
     sort_imports: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorsConfig:
     """
     Schema for error reporting configuration section
@@ -114,7 +127,7 @@ class ErrorsConfig:
     color: Literal["auto", "always", "never"] = "auto"
 
 
-@dataclass
+@dataclass(slots=True)
 class TypjaConfig:
     """
     Main configuration schema for typja.toml, encompassing all sections
@@ -137,22 +150,41 @@ class TypjaConfig:
     def root_path(self) -> Path:
         return Path(self.project.root)
 
+    @property
+    def template_dir_paths(self) -> tuple[Path, ...]:
+        return _join_paths(self.project.root, tuple(self.environment.template_dirs))
+
     def get_template_dirs(self) -> list[Path]:
-        return [self.root_path / path for path in self.environment.template_dirs]
+        return list(self.template_dir_paths)
 
     def get_type_paths(self) -> list[Path]:
-        import glob
-
-        paths: list[Path] = []
-        for pattern in self.project.paths:
+        # Keyed by path so files matched by overlapping patterns are only resolved once
+        paths: dict[Path, None] = {}
+        for pattern in dict.fromkeys(self.project.paths):
             full_pattern = str(self.root_path / pattern)
 
             if any(c in pattern for c in ["*", "?", "[", "]"]):
-                matched = glob.glob(full_pattern, recursive=True)
-                paths.extend(Path(p) for p in matched)
+                paths.update(dict.fromkeys(Path(p) for p in glob.glob(full_pattern, recursive=True)))
             else:
                 path = self.root_path / pattern
                 if path.exists():
-                    paths.append(path)
+                    paths[path] = None
+
+        return list(paths)
+
+
+@lru_cache(maxsize=32)
+def _join_paths(root: str, paths: tuple[str, ...]) -> tuple[Path, ...]:
+    """
+    Join config paths onto the project root, cached since the config is asked for them on every check
+
+    Args:
+        root (str): The project root
+        paths (tuple[str, ...]): Paths relative to the root
+
+    Returns:
+        tuple[Path, ...]: The joined paths
+    """
 
-        return paths
+    root_path = Path(root)
+    return tuple(root_path / path for path in paths)
@@ -1,32 +1,11 @@
-from functools import lru_cache
+import builtins
+import typing
 
 PACKAGE_NAME = "typja"
 
+# Public names of the builtins and typing modules, built once at import
+PYTHON_BUILTINS: frozenset[str] = frozenset(name for name in dir(builtins) if not name.startswith("_"))
 
-@lru_cache(maxsize=1)
-def get_builtins() -> set[str]:
-    """
-    Get a set of all Python builtin types
-    """
+TYPING_TYPES: frozenset[str] = frozenset(name for name in dir(typing) if not name.startswith("_"))
 
-    import builtins
-
-    public_attrs = [name for name in dir(builtins) if not name.startswith("_")]
-    return set(public_attrs)
-
-
-@lru_cache(maxsize=1)
-def get_typing_types() -> set[str]:
-    """
-    Get a set of all types from the typing module
-    """
-
-    import typing
-
-    public_attrs = [name for name in dir(typing) if not name.startswith("_")]
-    return set(public_attrs)
-
-
-PYTHON_BUILTINS = get_builtins()
-
-TYPING_TYPES = get_typing_types()
+BUILTIN_OR_TYPING = PYTHON_BUILTINS | TYPING_TYPES
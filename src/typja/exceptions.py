@@ -34,7 +34,11 @@ class TypjaValidationError(TypjaException):
     Raised when there is an error validating a value against a type definition
     """
 
-    pass
+    def __init__(self, message: str, line: int = 0, col: int = 0):
+        self.message = message
+        self.line = line
+        self.col = col
+        super().__init__(message)
 
 
 class TypjaConfigError(TypjaException):
@@ -1,5 +1,27 @@
+import mmap
+import os
+import pickle
+import re
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from pathlib import Path
 
+# Maximum number of template roots walked at the same time
+WALK_WORKERS = 8
+
+# Errors from a process pool that failed to start or to receive its work, rather than from the work itself.
+# Under spawn or forkserver the initializer arguments are pickled, and objects that can't be pickled raise
+# TypeError or AttributeError instead of PicklingError.
+POOL_FALLBACK_ERRORS: tuple[type[Exception], ...] = (
+    BrokenProcessPool,
+    pickle.PicklingError,
+    OSError,
+    TypeError,
+    AttributeError,
+)
+
 
 def find_templates(root: Path, include_patterns: list[str], exclude_patterns: list[str]) -> list[Path]:
     """
@@ -18,25 +40,278 @@ def find_templates(root: Path, include_patterns: list[str], exclude_patterns: li
         return []
 
     templates: list[Path] = []
+    include_regex = compile_include_patterns(tuple(include_patterns))
+    exclude_regex = compile_exclude_patterns(tuple(exclude_patterns))
+    excluded_dir_regex = _compile_excluded_dirs(tuple(exclude_patterns))
+
+    # One walk for all patterns; directories excluded outright (e.g. `**/node_modules/**`) are never entered
+    stack: list[tuple[str, str]] = [(str(root), "")]
+
+    while stack:
+        directory, prefix = stack.pop()
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    relative = prefix + entry.name
+
+                    if entry.is_dir(follow_symlinks=False):
+                        if not excluded_dir_regex.search(relative):
+                            stack.append((entry.path, relative + "/"))
+                    elif include_regex.search(relative) and not exclude_regex.search(relative) and entry.is_file():
+                        templates.append(Path(entry.path))
+        except (NotADirectoryError, PermissionError):
+            continue
+
+    return sorted(templates)
 
-    for pattern in include_patterns:
-        for file_path in root.rglob(pattern.lstrip("./")):
-            if file_path.is_file():
-                relative = file_path.relative_to(root)
-                should_exclude = False
 
-                for exc in exclude_patterns:
-                    if exc.startswith("**/") and exc.endswith("/**"):
-                        dir_name = exc[3:-3]
-                        if dir_name in relative.parts:
-                            should_exclude = True
-                            break
+def find_templates_multi(roots: Sequence[Path], include_patterns: list[str], exclude_patterns: list[str]) -> list[Path]:
+    """
+    Find template files matching patterns across several root directories, walking each directory once
 
-                    elif relative.match(exc):
-                        should_exclude = True
-                        break
+    Roots that are listed more than once, or that sit inside another listed root, are skipped since
+    the enclosing root's walk already covers them.
 
-                if not should_exclude:
-                    templates.append(file_path)
+    Args:
+        roots (Sequence[Path]): Root directories to search
+        include_patterns (list[str]): Patterns to include (e.g., ['*.html', '*.jinja'])
+        exclude_patterns (list[str]): Patterns to exclude (e.g., ['**/node_modules/**'])
+
+    Returns:
+        list[Path]: List of template file paths
+    """
+
+    resolved = {root.resolve(): root for root in roots if root.exists()}
+    walk_roots = [
+        root
+        for resolved_root, root in resolved.items()
+        if not any(parent in resolved for parent in resolved_root.parents)
+    ]
+
+    templates: list[Path] = []
+
+    if len(walk_roots) > 1:
+        # Directory walks mostly wait on the file system, so separate roots are walked concurrently
+        with ThreadPoolExecutor(max_workers=min(WALK_WORKERS, len(walk_roots))) as executor:
+            walks = executor.map(lambda root: find_templates(root, include_patterns, exclude_patterns), walk_roots)
+            for found in walks:
+                templates.extend(found)
+    else:
+        for root in walk_roots:
+            templates.extend(find_templates(root, include_patterns, exclude_patterns))
 
     return sorted(set(templates))
+
+
+def is_template(path: Path, root: Path, include_patterns: list[str], exclude_patterns: list[str]) -> bool:
+    """
+    Check whether a path would be picked up by `find_templates` for the given root and patterns
+
+    Args:
+        path (Path): The file path to check
+        root (Path): Root directory templates are searched from
+        include_patterns (list[str]): Patterns to include (e.g., ['*.html', '*.jinja'])
+        exclude_patterns (list[str]): Patterns to exclude (e.g., ['**/node_modules/**'])
+
+    Returns:
+        bool: True if the path is a template under root
+    """
+
+    try:
+        relative = path.relative_to(root).as_posix()
+    except ValueError:
+        return False
+
+    if not compile_include_patterns(tuple(include_patterns)).search(relative):
+        return False
+
+    return not compile_exclude_patterns(tuple(exclude_patterns)).search(relative)
+
+
+def read_template(path: Path) -> str:
+    """
+    Read a template file by memory-mapping it and decoding the mapped bytes directly
+
+    Args:
+        path (Path): Path to the template file
+
+    Returns:
+        str: The decoded template content, with line endings normalized to `\n` like `Path.read_text()`
+    """
+
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                content = str(mapped, "utf-8")
+                # Comment parsing and jinja must count the same lines, so translate newlines as text mode would
+                if mapped.find(b"\r") != -1:
+                    content = content.replace("\r\n", "\n").replace("\r", "\n")
+                return content
+        except ValueError:
+            # Empty files can't be memory-mapped
+            return ""
+
+
+def split_top_level(text: str, delimiter: str = ",") -> list[str]:
+    """
+    Split text on a delimiter, ignoring delimiters nested inside brackets
+
+    Args:
+        text (str): The text to split, e.g. `str, dict[str, int]`
+        delimiter (str): The single character to split on
+
+    Returns:
+        list[str]: The unstripped parts, without a trailing empty part
+    """
+
+    parts: list[str] = []
+    depth = 0
+    start = 0
+
+    # Only brackets and delimiters matter, so jump between them instead of walking every character
+    for match in _split_regex(delimiter).finditer(text):
+        char = match.group()
+        if char in "[({":
+            depth += 1
+        elif char in "])}":
+            depth -= 1
+        elif depth == 0:
+            parts.append(text[start : match.start()])
+            start = match.end()
+
+    if start < len(text):
+        parts.append(text[start:])
+
+    return parts
+
+
+@lru_cache(maxsize=8)
+def _split_regex(delimiter: str) -> re.Pattern[str]:
+    return re.compile(f"[\\[\\](){{}}{re.escape(delimiter)}]")
+
+
+@lru_cache(maxsize=64)
+def compile_include_patterns(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """
+    Compile include patterns into one regex matched against a template's path relative to its root
+
+    Args:
+        patterns (tuple[str, ...]): Glob patterns to include (e.g., ('*.html', '*.jinja'))
+
+    Returns:
+        re.Pattern[str]: A regex that searches true when any pattern matches
+    """
+
+    return _combine([_path_match_regex(pattern.lstrip("./"), recursive=True) for pattern in patterns])
+
+
+@lru_cache(maxsize=64)
+def compile_exclude_patterns(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """
+    Compile exclude patterns into one regex matched against a path relative to the searched root
+
+    `**/name/**` patterns exclude any path with a `name` component, other patterns follow `Path.match`.
+
+    Args:
+        patterns (tuple[str, ...]): Glob patterns to exclude (e.g., ('**/node_modules/**',))
+
+    Returns:
+        re.Pattern[str]: A regex that searches true when any pattern matches
+    """
+
+    regexes: list[str] = []
+    for pattern in patterns:
+        if pattern.startswith("**/") and pattern.endswith("/**"):
+            regexes.append(f"(?:^|/){re.escape(pattern[3:-3])}(?:/|$)")
+        else:
+            regexes.append(_path_match_regex(pattern))
+
+    return _combine(regexes)
+
+
+@lru_cache(maxsize=64)
+def _compile_excluded_dirs(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """
+    Compile the `**/name/**` exclude patterns, which exclude whole directories, so walks can skip them
+
+    Args:
+        patterns (tuple[str, ...]): Glob patterns to exclude
+
+    Returns:
+        re.Pattern[str]: A regex that searches true for a directory whose contents are all excluded
+    """
+
+    return _combine(
+        [
+            f"(?:^|/){re.escape(pattern[3:-3])}$"
+            for pattern in patterns
+            if pattern.startswith("**/") and pattern.endswith("/**")
+        ]
+    )
+
+
+def _combine(regexes: list[str]) -> re.Pattern[str]:
+
+    if not regexes:
+        return re.compile(r"(?!)")
+
+    return re.compile("|".join(f"(?:{regex})" for regex in regexes))
+
+
+def _path_match_regex(pattern: str, recursive: bool = False) -> str:
+    """
+    Translate a glob pattern into a regex with `PurePath.match` semantics: relative patterns match
+    from the right, and wildcards never cross a `/`
+
+    Args:
+        pattern (str): The glob pattern
+        recursive (bool): Whether `**` segments match any number of directories, as in `Path.rglob`
+
+    Returns:
+        str: The regex source
+    """
+
+    anchored = pattern.startswith("/")
+    segments = [segment for segment in pattern.strip("/").split("/") if segment]
+
+    parts: list[str] = []
+    for index, segment in enumerate(segments):
+        last = index == len(segments) - 1
+
+        if recursive and segment == "**":
+            parts.append("(?:[^/]+/)*[^/]+" if last else "(?:[^/]+/)*")
+        else:
+            parts.append(_segment_regex(segment) + ("" if last else "/"))
+
+    prefix = "^/" if anchored else "(?:^|/)"
+    return prefix + "".join(parts) + "$"
+
+
+def _segment_regex(segment: str) -> str:
+
+    parts: list[str] = []
+    i = 0
+
+    while i < len(segment):
+        char = segment[i]
+        i += 1
+
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            end = segment.find("]", i + 1 if segment[i : i + 1] in ("!", "]") else i)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                body = segment[i:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+                i = end + 1
+        else:
+            parts.append(re.escape(char))
+
+    return "".join(parts)
@@ -1,10 +1,24 @@
+import hashlib
 import re
+from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import pairwise
 from typing import Any, Literal
 
 from typja.analyzer import ValidationIssue
-from typja.parser import CommentParser, FromImportStatement, ImportStatement, TypeAnnotation, TypjaComment
+from typja.helpers import split_top_level
+from typja.parser import (
+    CommentParser,
+    FilterDeclaration,
+    FromImportStatement,
+    ImportStatement,
+    MacroDeclaration,
+    TypeAnnotation,
+    TypjaComment,
+    VariableDeclaration,
+)
 
 
 @dataclass
@@ -32,9 +46,44 @@ class Linter:
     Linter for typja in jinja templates
     """
 
+    # Maximum number of lint results, and of parsed comments, kept for unchanged templates
+    CACHE_SIZE = 256
+
+    # Old-style unions matched on a single line, compiled once instead of on every line checked
+    _OPTIONAL_RE = re.compile(r"Optional\[[^\]]+\]")
+    _UNION_RE = re.compile(r"Union\[[^\]]+\]")
+
+    # Words joined by attribute dots, used to tokenize a template once for the unused-import checks
+    _CHAIN_RE = re.compile(r"\w+(?:\.\w+)*")
+
+    # Rules that work on the parsed typja comments rather than the raw content
+    _COMMENT_RULES = frozenset(
+        {"no-unused-imports", "no-duplicate-declarations", "sorted-imports", "no-redundant-none"}
+    )
+
     def __init__(self):
         self.rules = self._create_rules()
         self.comment_parser = CommentParser()
+        self._cache: OrderedDict[tuple[str, bytes, str], list[ValidationIssue]] = OrderedDict()
+        self._comment_cache: OrderedDict[tuple[str, bytes], list[TypjaComment]] = OrderedDict()
+
+        # Enabled rules per linting config, worked out once rather than for every template
+        self._enabled_rules: dict[str, list[tuple[LintRule, Literal["error", "warning"]]]] = {}
+
+        # The annotations each declaration type carries, in the order they are reported
+        self._declared_annotations: dict[type, Callable[[Any], tuple[TypeAnnotation, ...]]] = {
+            VariableDeclaration: self._typed_annotations,
+            FilterDeclaration: self._typed_annotations,
+            MacroDeclaration: self._macro_annotations,
+        }
+
+        self._rule_handlers: dict[str, Callable[..., list[ValidationIssue]]] = {
+            "prefer-pep604-union": self._apply_pep604_union,
+            "no-unused-imports": self._apply_unused_imports,
+            "no-duplicate-declarations": self._apply_duplicate_declarations,
+            "sorted-imports": self._apply_sorted_imports,
+            "no-redundant-none": self._apply_redundant_none,
+        }
 
     def _create_rules(self) -> list[LintRule]:
         return [
@@ -77,26 +126,40 @@ class Linter:
 
     def lint_template(self, content: str, filename: str, config: dict[str, Any]) -> list[ValidationIssue]:
 
-        issues: list[ValidationIssue] = []
         rule_config = config.get("linting", {})
+        config_key = repr(sorted(rule_config.items()))
+
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+        cache_key = (filename, digest, config_key)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return list(cached)
+
+        enabled = self._enabled_rules.get(config_key)
+        if enabled is None:
+            enabled = self._enabled_rules[config_key] = self._resolve_enabled_rules(rule_config)
+
+        issues = self._lint(content, filename, enabled, digest)
+
+        self._cache[cache_key] = issues
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
 
-        parsed_comments = None
-        needs_comments = any(
-            rule.name
-            in [
-                "no-unused-imports",
-                "no-duplicate-declarations",
-                "sorted-imports",
-                "no-redundant-none",
-            ]
-            for rule in self.rules
-        )
-
-        if needs_comments:
-            try:
-                parsed_comments = self.comment_parser.parse_template(content, filename)
-            except Exception:
-                parsed_comments = []
+        return list(issues)
+
+    def _resolve_enabled_rules(self, rule_config: dict[str, Any]) -> list[tuple[LintRule, Literal["error", "warning"]]]:
+        """
+        Work out which rules a linting config enables, and the severity each reports at
+
+        Args:
+            rule_config (dict[str, Any]): The linting section of the config
+
+        Returns:
+            list[tuple[LintRule, Literal["error", "warning"]]]: The enabled rules with their severities
+        """
+
+        enabled: list[tuple[LintRule, Literal["error", "warning"]]] = []
 
         for rule in self.rules:
             if rule.name == "prefer-pep604-union":
@@ -114,57 +177,149 @@ class Linter:
             else:
                 severity = rule.severity
 
+            enabled.append((rule, severity))
+
+        return enabled
+
+    def _lint(
+        self,
+        content: str,
+        filename: str,
+        enabled: list[tuple[LintRule, Literal["error", "warning"]]],
+        digest: bytes,
+    ) -> list[ValidationIssue]:
+
+        issues: list[ValidationIssue] = []
+
+        # The comments are only parsed when an enabled rule reads them
+        parsed_comments: list[TypjaComment] = []
+        if any(rule.name in self._COMMENT_RULES for rule, _ in enabled):
+            parsed_comments = self._parse_comments(content, filename, digest)
+
+        for rule, severity in enabled:
             rule_issues = self._apply_rule(rule, content, filename, severity, parsed_comments)
             issues.extend(rule_issues)
 
         return issues
 
+    def _parse_comments(self, content: str, filename: str, digest: bytes) -> list[TypjaComment]:
+        """
+        Parse a template's typja comments, reusing the result for content that was parsed before
+
+        Args:
+            content (str): The template content
+            filename (str): The template filename
+            digest (bytes): The content digest the result is cached under
+
+        Returns:
+            list[TypjaComment]: The parsed comments, empty if they could not be parsed
+        """
+
+        cache_key = (filename, digest)
+        comments = self._comment_cache.get(cache_key)
+        if comments is not None:
+            self._comment_cache.move_to_end(cache_key)
+            return comments
+
+        try:
+            comments = self.comment_parser.parse_template(content, filename)
+        except Exception:
+            comments = []
+
+        self._comment_cache[cache_key] = comments
+        if len(self._comment_cache) > self.CACHE_SIZE:
+            self._comment_cache.popitem(last=False)
+
+        return comments
+
     def _apply_rule(
         self,
         rule: LintRule,
         content: str,
         filename: str,
         severity: Literal["error", "warning"],
-        parsed_comments: list[TypjaComment] | None,
+        parsed_comments: list[TypjaComment],
+    ) -> list[ValidationIssue]:
+
+        handler = self._rule_handlers.get(rule.name)
+        if handler is None:
+            return []
+
+        return handler(rule, content, filename, severity, parsed_comments)
+
+    def _apply_pep604_union(
+        self,
+        rule: LintRule,
+        content: str,
+        filename: str,
+        severity: Literal["error", "warning"],
+        parsed_comments: list[TypjaComment],
     ) -> list[ValidationIssue]:
 
         issues: list[ValidationIssue] = []
 
-        if rule.name == "prefer-pep604-union":
-            for line_num, line in enumerate(content.splitlines(), 1):
-                if "Optional[" in line or "Union[" in line:
-                    old_style = self._extract_old_union(line)
+        # Most templates have no old-style unions, so skip splitting them into lines at all
+        if "Optional[" not in content and "Union[" not in content:
+            return issues
 
-                    if old_style:
-                        new_style = self._fix_pep604_union(old_style)
+        for line_num, line in enumerate(content.splitlines(), 1):
+            if "Optional[" in line or "Union[" in line:
+                old_style = self._extract_old_union(line)
 
-                        issues.append(
-                            ValidationIssue(
-                                severity=severity,
-                                message=rule.message.format(old_style=old_style),
-                                filename=filename,
-                                line=line_num,
-                                hint=f"Use: {new_style}",
-                            )
+                if old_style:
+                    new_style = self._fix_pep604_union(old_style)
+
+                    issues.append(
+                        ValidationIssue(
+                            severity=severity,
+                            message=rule.message.format(old_style=old_style),
+                            filename=filename,
+                            line=line_num,
+                            hint=f"Use: {new_style}",
                         )
+                    )
 
-        elif rule.name == "no-unused-imports":
-            if parsed_comments is not None:
-                issues.extend(self._check_all_unused_imports(content, filename, severity, parsed_comments))
+        return issues
 
-        elif rule.name == "no-duplicate-declarations":
-            if parsed_comments is not None:
-                issues.extend(self._check_all_duplicate_declarations(filename, severity, parsed_comments))
+    def _apply_unused_imports(
+        self,
+        rule: LintRule,
+        content: str,
+        filename: str,
+        severity: Literal["error", "warning"],
+        parsed_comments: list[TypjaComment],
+    ) -> list[ValidationIssue]:
+        return self._check_all_unused_imports(content, filename, severity, parsed_comments)
 
-        elif rule.name == "sorted-imports":
-            if parsed_comments is not None:
-                issues.extend(self._check_all_sorted_imports(filename, severity, parsed_comments))
+    def _apply_duplicate_declarations(
+        self,
+        rule: LintRule,
+        content: str,
+        filename: str,
+        severity: Literal["error", "warning"],
+        parsed_comments: list[TypjaComment],
+    ) -> list[ValidationIssue]:
+        return self._check_all_duplicate_declarations(filename, severity, parsed_comments)
 
-        elif rule.name == "no-redundant-none":
-            if parsed_comments is not None:
-                issues.extend(self._check_all_redundant_none(filename, severity, parsed_comments))
+    def _apply_sorted_imports(
+        self,
+        rule: LintRule,
+        content: str,
+        filename: str,
+        severity: Literal["error", "warning"],
+        parsed_comments: list[TypjaComment],
+    ) -> list[ValidationIssue]:
+        return self._check_all_sorted_imports(filename, severity, parsed_comments)
 
-        return issues
+    def _apply_redundant_none(
+        self,
+        rule: LintRule,
+        content: str,
+        filename: str,
+        severity: Literal["error", "warning"],
+        parsed_comments: list[TypjaComment],
+    ) -> list[ValidationIssue]:
+        return self._check_all_redundant_none(filename, severity, parsed_comments)
 
     def _check_pep604_union(self, type_annotation: TypeAnnotation) -> bool:
         if type_annotation.name in ["Union", "Optional"]:
@@ -174,14 +329,18 @@ class Linter:
         return True
 
     def _check_unused_import(self, import_name: str, content: str) -> bool:
-        type_pattern = rf"\b{re.escape(import_name)}\b"
+        # A plain substring scan rules out most names before any regex runs
+        if import_name not in content:
+            return False
+
+        type_pattern = _name_regex(import_name)
 
-        if re.search(type_pattern, content):
+        if type_pattern.search(content):
             lines = content.splitlines()
             for line in lines:
-                if "typja:import" in line or "typja:from" in line:
+                if import_name not in line or "typja:import" in line or "typja:from" in line:
                     continue
-                if re.search(type_pattern, line):
+                if type_pattern.search(line):
                     return True
 
         return False
@@ -198,12 +357,16 @@ class Linter:
         return imports == sorted(imports)
 
     def _check_redundant_none(self, type_str: str) -> bool:
-        if "|" in type_str:
-            parts = [p.strip() for p in type_str.split("|")]
-            none_count = parts.count("None")
+        if "|" not in type_str:
+            return True
 
-            if none_count > 1:
-                return False
+        # Stop at the second None rather than stripping and counting every member
+        seen_none = False
+        for part in type_str.split("|"):
+            if part.strip() == "None":
+                if seen_none:
+                    return False
+                seen_none = True
 
         return True
 
@@ -217,13 +380,23 @@ class Linter:
 
         issues: list[ValidationIssue] = []
 
+        # The content is tokenized once, on first use, so each import is a set lookup rather than a scan
+        usage: tuple[set[str], set[str]] | None = None
+
         for comment in parsed_comments:
             for decl in comment.declarations:
                 if isinstance(decl, ImportStatement):
                     module = decl.module
                     line = decl.line
 
-                    if not re.search(rf"\b{re.escape(module)}\.\w+", content):
+                    if all(part.isidentifier() for part in module.split(".")):
+                        if usage is None:
+                            usage = self._collect_usage(content)
+                        used = module in usage[1]
+                    else:
+                        used = bool(_module_attr_regex(module).search(content))
+
+                    if not used:
                         issues.append(
                             ValidationIssue(
                                 severity=severity,
@@ -242,7 +415,14 @@ class Linter:
                     for name, alias in names:
                         check_name = alias if alias else name
 
-                        if not self._check_unused_import(check_name, content):
+                        if check_name.isidentifier():
+                            if usage is None:
+                                usage = self._collect_usage(content)
+                            used = check_name in usage[0]
+                        else:
+                            used = self._check_unused_import(check_name, content)
+
+                        if not used:
                             issues.append(
                                 ValidationIssue(
                                     severity=severity,
@@ -255,6 +435,36 @@ class Linter:
 
         return issues
 
+    def _collect_usage(self, content: str) -> tuple[set[str], set[str]]:
+        """
+        Collect the names a template uses, in a single pass over its content
+
+        Args:
+            content (str): The template content
+
+        Returns:
+            tuple[set[str], set[str]]: Every whole word on a line that isn't a typja import, and every
+                name followed by an attribute, e.g. `os`, `os.path` and `path` for `os.path.join`
+        """
+
+        names: set[str] = set()
+        modules: set[str] = set()
+
+        # Dotted chains never span lines, so one match per chain serves both sets
+        for line in content.splitlines():
+            is_import = "typja:import" in line or "typja:from" in line
+
+            for chain in self._CHAIN_RE.findall(line):
+                parts = chain.split(".")
+                if not is_import:
+                    names.update(parts)
+
+                for start in range(len(parts) - 1):
+                    for end in range(start + 1, len(parts)):
+                        modules.add(".".join(parts[start:end]))
+
+        return names, modules
+
     def _check_all_duplicate_declarations(
         self,
         filename: str,
@@ -353,9 +563,10 @@ class Linter:
         if len(imports_block) <= 1:
             return issues
 
-        sorted_block = sorted(imports_block, key=lambda x: x[1])
+        # A single pass that stops at the first out-of-order pair, instead of sorting a copy to compare
+        is_sorted = all(current[1] <= following[1] for current, following in pairwise(imports_block))
 
-        if imports_block != sorted_block:
+        if not is_sorted:
             first_line = imports_block[0][0]
             issues.append(
                 ValidationIssue(
@@ -378,58 +589,40 @@ class Linter:
 
         issues: list[ValidationIssue] = []
 
+        handlers = self._declared_annotations
+
         for comment in parsed_comments:
             for decl in comment.declarations:
-                type_annotation = None
-                line = decl.line
-
-                if hasattr(decl, "type_annotation"):
-                    type_annotation = decl.type_annotation  # type: ignore[attr-defined]
-
-                if hasattr(decl, "params"):
-                    params = decl.params  # type: ignore[attr-defined]
-                    for _, param_type, _, _ in params:
-                        if self._has_redundant_none(param_type):
-                            issues.append(
-                                ValidationIssue(
-                                    severity=severity,
-                                    message="Redundant None in union type",
-                                    filename=filename,
-                                    line=line,
-                                    hint="Remove duplicate None types",
-                                )
-                            )
+                get_annotations = handlers.get(type(decl))
+                if get_annotations is None:
+                    continue
 
-                if hasattr(decl, "return_type"):
-                    return_type = decl.return_type  # type: ignore[attr-defined]
-                    if self._has_redundant_none(return_type):
+                for type_annotation in get_annotations(decl):
+                    if self._has_redundant_none(type_annotation):
                         issues.append(
                             ValidationIssue(
                                 severity=severity,
                                 message="Redundant None in union type",
                                 filename=filename,
-                                line=line,
+                                line=decl.line,
                                 hint="Remove duplicate None types",
                             )
                         )
 
-                if type_annotation and self._has_redundant_none(type_annotation):
-                    issues.append(
-                        ValidationIssue(
-                            severity=severity,
-                            message="Redundant None in union type",
-                            filename=filename,
-                            line=line,
-                            hint="Remove duplicate None types",
-                        )
-                    )
-
         return issues
 
+    @staticmethod
+    def _typed_annotations(decl: VariableDeclaration | FilterDeclaration) -> tuple[TypeAnnotation, ...]:
+        return (decl.type_annotation,)
+
+    @staticmethod
+    def _macro_annotations(decl: MacroDeclaration) -> tuple[TypeAnnotation, ...]:
+        return (*(param_type for _, param_type, _, _ in decl.params), decl.return_type)
+
     def _has_redundant_none(self, type_annotation: TypeAnnotation) -> bool:
         if type_annotation.is_union and type_annotation.union_types:
-            none_count = sum(1 for t in type_annotation.union_types if t.name == "None")
-            return none_count > 1
+            none_types = (t for t in type_annotation.union_types if t.name == "None")
+            return next(none_types, None) is not None and next(none_types, None) is not None
 
         return False
 
@@ -446,56 +639,56 @@ class Linter:
         return old_union
 
     def _extract_old_union(self, line: str) -> str | None:
-        import re
+        match = self._OPTIONAL_RE.search(line) or self._UNION_RE.search(line)
+        return match.group(0) if match else None
 
-        match = re.search(r"Optional\[[^\]]+\]", line)
-        if match:
-            return match.group(0)
-
-        match = re.search(r"Union\[[^\]]+\]", line)
-        if match:
-            return match.group(0)
+    def _split_union_args(self, args: str) -> list[str]:
+        return list(_split_top_level(args))
 
-        return None
+    @staticmethod
+    def is_fixable(issue: ValidationIssue) -> bool:
+        """
+        Check whether `auto_fix` can fix an issue
 
-    def _split_union_args(self, args: str) -> list[str]:
-        result = []
-        current = []
-        depth = 0
-
-        for char in args:
-            if char in "[({":
-                depth += 1
-                current.append(char)
-            elif char in "])}":
-                depth -= 1
-                current.append(char)
-            elif char == "," and depth == 0:
-                result.append("".join(current).strip())
-                current = []
-            else:
-                current.append(char)
+        Args:
+            issue (ValidationIssue): The issue to check
 
-        if current:
-            result.append("".join(current).strip())
+        Returns:
+            bool: True if the issue has an automatic fix
+        """
 
-        return result
+        return "Use PEP 604" in issue.message and issue.hint is not None and issue.hint.startswith("Use: ")
 
     def auto_fix(self, content: str, issues: list[ValidationIssue]) -> str:
-        fixed_content = content
+        # Split once and join once, however many fixes apply; line endings are kept as they were
+        lines: list[str] | None = None
 
         for issue in issues:
-            if "Use PEP 604" in issue.message and issue.hint:
-                if issue.hint.startswith("Use: "):
-                    new_style = issue.hint[5:]
-                    lines = fixed_content.splitlines()
+            if self.is_fixable(issue) and issue.hint:
+                if lines is None:
+                    lines = content.splitlines(keepends=True)
+
+                if 0 < issue.line <= len(lines):
+                    line = lines[issue.line - 1]
+                    old_style = self._extract_old_union(line)
+
+                    if old_style:
+                        lines[issue.line - 1] = line.replace(old_style, issue.hint[5:])
+
+        return content if lines is None else "".join(lines)
+
+
+@lru_cache(maxsize=512)
+def _split_top_level(args: str) -> tuple[str, ...]:
+    return tuple(arg.strip() for arg in split_top_level(args, ","))
+
 
-                    if 0 < issue.line <= len(lines):
-                        line = lines[issue.line - 1]
-                        old_style = self._extract_old_union(line)
+# Imported names repeat across templates, so their patterns are compiled once and reused
+@lru_cache(maxsize=512)
+def _name_regex(name: str) -> re.Pattern[str]:
+    return re.compile(rf"\b{re.escape(name)}\b")
 
-                        if old_style:
-                            lines[issue.line - 1] = line.replace(old_style, new_style)
-                            fixed_content = "\n".join(lines)
 
-        return fixed_content
+@lru_cache(maxsize=512)
+def _module_attr_regex(module: str) -> re.Pattern[str]:
+    return re.compile(rf"\b{re.escape(module)}\.\w+")
@@ -1,8 +1,11 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Any, Literal
 
+from typja.constants import PYTHON_BUILTINS, TYPING_TYPES
 
-@dataclass
+
+@dataclass(slots=True)
 class TypeAnnotation:
     """
     Schema representing a type annotation in jinja templates in typja comments
@@ -14,6 +17,8 @@ class TypeAnnotation:
         args (list[TypeAnnotation] | None): The generic arguments
         is_union (bool): Whether the type is a union type
         union_types (list[TypeAnnotation] | None): The types in the union if is_union is True
+        flat_types (tuple[TypeAnnotation, ...]): The union alternatives if is_union is True, otherwise just this type
+        kind (Literal["union", "builtin", "typing", "qualified", "name"]): How the type is resolved, set from the other fields
 
     Examples:
 
@@ -26,8 +31,40 @@ class TypeAnnotation:
     args: list["TypeAnnotation"] | None = None
     is_union: bool = False
     union_types: list["TypeAnnotation"] | None = None
+    flat_types: tuple["TypeAnnotation", ...] = field(init=False, repr=False, compare=False)
+    kind: Literal["union", "builtin", "typing", "qualified", "name"] = field(init=False, repr=False, compare=False)
+    _str: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Type names are looked up in many dicts and sets, interning lets those lookups match by identity
+        self.name = sys.intern(self.name)
+        if self.module is not None:
+            self.module = sys.intern(self.module)
+
+        if self.is_union and self.union_types:
+            self.flat_types = tuple(self.union_types)
+        else:
+            self.flat_types = (self,)
+
+        # Classified once here so resolving the type branches on one field instead of several lookups
+        if self.is_union:
+            self.kind = "union"
+        elif self.name in PYTHON_BUILTINS:
+            self.kind = "builtin"
+        elif self.name in TYPING_TYPES:
+            self.kind = "typing"
+        elif self.module:
+            self.kind = "qualified"
+        else:
+            self.kind = "name"
 
     def __str__(self) -> str:
+        # Enclosing declarations and error messages stringify the same annotation repeatedly, so keep the result
+        if self._str is None:
+            self._str = self._format()
+        return self._str
+
+    def _format(self) -> str:
         if self.is_union and self.union_types:
             return " | ".join(str(t) for t in self.union_types)
 
@@ -43,7 +80,7 @@ class TypeAnnotation:
         return base
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportStatement:
     """
     Schema representing an import statement in jinja templates in typja comments
@@ -66,7 +103,7 @@ class ImportStatement:
         return f"import {self.module}"
 
 
-@dataclass
+@dataclass(slots=True)
 class FromImportStatement:
     """
     Schema representing a from-import statement in jinja templates in typja comments
@@ -92,7 +129,7 @@ class FromImportStatement:
         return f"from {self.module} import {imports}"
 
 
-@dataclass
+@dataclass(slots=True)
 class VariableDeclaration:
     """
     Schema representing a variable declaration in jinja templates in typja comments
@@ -113,11 +150,14 @@ class VariableDeclaration:
     line: int
     col: int = 0
 
+    def __post_init__(self) -> None:
+        self.name = sys.intern(self.name)
+
     def __str__(self) -> str:
         return f"{self.name}: {self.type_annotation}"
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterDeclaration:
     """
     Schema representing a filter declaration in jinja templates in typja comments
@@ -138,11 +178,14 @@ class FilterDeclaration:
     line: int
     col: int = 0
 
+    def __post_init__(self) -> None:
+        self.name = sys.intern(self.name)
+
     def __str__(self) -> str:
         return f"filter {self.name}: {self.type_annotation}"
 
 
-@dataclass
+@dataclass(slots=True)
 class MacroDeclaration:
     """
     Schema for representing Macro Declarations in jinja templates in typja comments
@@ -157,6 +200,8 @@ class MacroDeclaration:
         return_type (TypeAnnotation): The return type annotation of the macro
         line (int): The line number where the macro declaration is located in the source code
         col (int): The column number where the macro declaration starts in the source code (default is 0)
+        required_params (tuple[str, ...]): Names of the parameters without a default value, derived from params
+        param_names (frozenset[str]): Names of all parameters, derived from params
 
     Examples:
 
@@ -168,6 +213,13 @@ class MacroDeclaration:
     return_type: TypeAnnotation
     line: int
     col: int = 0
+    required_params: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    param_names: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.name = sys.intern(self.name)
+        self.required_params = tuple(name for name, _, has_default, _ in self.params if not has_default)
+        self.param_names = frozenset(name for name, _, _, _ in self.params)
 
     def __str__(self) -> str:
         params_str = ", ".join(
@@ -177,7 +229,7 @@ class MacroDeclaration:
         return f"macro {self.name}({params_str}) -> {self.return_type}"
 
 
-@dataclass
+@dataclass(slots=True)
 class TypjaComment:
     """
     Schema for all declarations or directives in a single typja comment
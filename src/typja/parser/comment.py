@@ -1,7 +1,9 @@
 import re
+from collections.abc import Callable
 from typing import Any
 
 from typja.exceptions import TypjaParseError
+from typja.helpers import split_top_level
 from typja.parser.ast import (
     FilterDeclaration,
     FromImportStatement,
@@ -23,19 +25,43 @@ class CommentParser:
     # Regex to find typja comments
     TYPJA_COMMENT_PATTERN = re.compile(r"\{#\s*typja:([^#]+?)#\}", re.MULTILINE | re.DOTALL)
 
-    # Multi-line block pattern
-    TYPJA_BLOCK_PATTERN = re.compile(r"\{#\s*typja:([^#]+?)#\}", re.MULTILINE | re.DOTALL)
+    # Literal present in every typja comment, used to skip templates without any
+    TYPJA_MARKER = "typja:"
+
+    # Directive that starts a comment body, matched once instead of trying each prefix in turn
+    DIRECTIVE_PATTERN = re.compile(r"import |from |var|filter |macro |ignore(?= |\Z)")
+
+    # Macro signature "name(params) -> return", params run to the last ")" that is followed by the return type
+    MACRO_PATTERN = re.compile(r"([^(]*)\((.*)\)\s*(?:->(.*))?", re.DOTALL)
 
     def __init__(self):
         self.import_parser = ImportParser()
         self.type_parser = TypeParser()
 
+        self._directive_handlers: dict[str, Callable[[str, int, int, str], TypjaComment]] = {
+            "import ": self._parse_import,
+            "from ": self._parse_from_import,
+            "var": self._parse_variables,
+            "filter ": self._parse_filter,
+            "macro ": self._parse_macro,
+            "ignore": self._parse_ignore,
+        }
+
     def parse_template(self, content: str, filename: str = "<unknown>") -> list[TypjaComment]:
         comments: list[TypjaComment] = []
 
+        if self.TYPJA_MARKER not in content:
+            return comments
+
+        # Track line numbers incrementally so the source is only scanned once
+        line = 1
+        last_pos = 0
+
         for match in self.TYPJA_COMMENT_PATTERN.finditer(content):
-            line = content[: match.start()].count("\n") + 1
-            col = match.start() - content.rfind("\n", 0, match.start())
+            start = match.start()
+            line += content.count("\n", last_pos, start)
+            last_pos = start
+            col = start - content.rfind("\n", 0, start)
             raw = match.group(0)
             body = match.group(1).strip()
 
@@ -52,21 +78,15 @@ class CommentParser:
 
     def _parse_comment_body(self, body: str, line: int, col: int, raw: str) -> TypjaComment:
 
-        if body.startswith("import "):
-            return self._parse_import(body, line, col, raw)
-        elif body.startswith("from "):
-            return self._parse_from_import(body, line, col, raw)
-        elif body.startswith("var"):
-            return self._parse_variables(body, line, col, raw)
-        elif body.startswith("filter "):
-            return self._parse_filter(body, line, col, raw)
-        elif body.startswith("macro "):
-            return self._parse_macro(body, line, col, raw)
-        elif body == "ignore" or body.startswith("ignore "):
-            return TypjaComment(kind="ignore", declarations=[], line=line, col=col, raw=raw)
-        else:
+        match = self.DIRECTIVE_PATTERN.match(body)
+        if match is None:
             raise TypjaParseError(f"Unknown typja directive: {body[:20]}...", line=line, col=col)
 
+        return self._directive_handlers[match.group()](body, line, col, raw)
+
+    def _parse_ignore(self, body: str, line: int, col: int, raw: str) -> TypjaComment:
+        return TypjaComment(kind="ignore", declarations=[], line=line, col=col, raw=raw)
+
     def _parse_import(self, body: str, line: int, col: int, raw: str) -> TypjaComment:
         stmt = self.import_parser.parse_import(body, line, col)
         return TypjaComment(kind="import", declarations=[stmt], line=line, col=col, raw=raw)
@@ -89,10 +109,10 @@ class CommentParser:
             if not part:
                 continue
 
-            if ":" not in part:
+            name, sep, type_str = part.partition(":")
+            if not sep:
                 raise TypjaParseError(f"Invalid variable declaration: {part}", line=line, col=col)
 
-            name, type_str = part.split(":", 1)
             name = name.strip()
             type_str = type_str.strip()
 
@@ -108,10 +128,10 @@ class CommentParser:
     def _parse_filter(self, body: str, line: int, col: int, raw: str) -> TypjaComment:
         body = body[7:].strip()
 
-        if ":" not in body:
+        name, sep, type_str = body.partition(":")
+        if not sep:
             raise TypjaParseError(f"Invalid filter declaration: {body}", line=line, col=col)
 
-        name, type_str = body.split(":", 1)
         name = name.strip()
         type_str = type_str.strip()
 
@@ -128,16 +148,13 @@ class CommentParser:
     def _parse_macro(self, body: str, line: int, col: int, raw: str) -> TypjaComment:
         body = body[6:].strip()
 
-        if "(" not in body or ")" not in body:
+        match = self.MACRO_PATTERN.fullmatch(body)
+        if not match:
             raise TypjaParseError(f"Invalid macro declaration: {body}", line=line, col=col)
 
-        name = body[: body.index("(")].strip()
-        params_end = body.rindex(")")
-        params_str = body[body.index("(") + 1 : params_end].strip()
-
-        return_type_str = None
-        if "->" in body[params_end:]:
-            return_type_str = body[body.index("->") + 2 :].strip()
+        name = match.group(1).strip()
+        params_str = match.group(2).strip()
+        return_type_str = (match.group(3) or "").strip()
 
         if not return_type_str:
             raise TypjaParseError(f"Macro must specify return type: {body}", line=line, col=col)
@@ -150,21 +167,20 @@ class CommentParser:
                     continue
 
                 default: str | None = None
-                has_default = False
-                if "=" in param:
-                    param, default_str = param.split("=", 1)
+                param, eq, default_str = param.partition("=")
+                has_default = bool(eq)
+                if has_default:
                     param = param.strip()
                     default = default_str.strip()
-                    has_default = True
 
-                if ":" not in param:
+                param_name, sep, param_type_str = param.partition(":")
+                if not sep:
                     raise TypjaParseError(
                         f"Parameter must have type annotation: {param}",
                         line=line,
                         col=col,
                     )
 
-                param_name, param_type_str = param.split(":", 1)
                 param_name = param_name.strip()
                 param_type_str = param_type_str.strip()
 
@@ -198,24 +214,4 @@ class CommentParser:
 
     @staticmethod
     def _split_preserving_brackets(text: str, delimiter: str) -> list[str]:
-        parts: list[str] = []
-        current: list[str] = []
-        depth = 0
-
-        for char in text:
-            if char in "[({":
-                depth += 1
-                current.append(char)
-            elif char in "])}":
-                depth -= 1
-                current.append(char)
-            elif char == delimiter and depth == 0:
-                parts.append("".join(current))
-                current = []
-            else:
-                current.append(char)
-
-        if current:
-            parts.append("".join(current))
-
-        return parts
+        return split_top_level(text, delimiter)
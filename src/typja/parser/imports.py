@@ -16,6 +16,12 @@ class ImportParser:
     # Supports relative imports: from .module or from ..module
     FROM_IMPORT_PATTERN = re.compile(r"^from\s+(\.+[a-zA-Z_][a-zA-Z0-9_.]*|[a-zA-Z_][a-zA-Z0-9_.]*)\s+import\s+(.+)$")
 
+    # For each "name" or "name as alias" in the imported names of a from-import
+    NAME_ALIAS_PATTERN = re.compile(r"([A-Za-z_]\w*)(?:\s+as\s+([A-Za-z_]\w*))?")
+
+    # The whole comma separated list of imported names, checked before it is split into names
+    NAMES_PATTERN = re.compile(rf"\s*{NAME_ALIAS_PATTERN.pattern}(?:\s*,\s*{NAME_ALIAS_PATTERN.pattern})*\s*")
+
     def parse_import(self, text: str, line: int, col: int) -> ImportStatement:
         match = self.IMPORT_PATTERN.match(text.strip())
 
@@ -34,14 +40,9 @@ class ImportParser:
         module = match.group(1)
         imports_str = match.group(2)
 
-        names = []
-        for import_part in imports_str.split(","):
-            import_part = import_part.strip()
+        if not self.NAMES_PATTERN.fullmatch(imports_str):
+            raise TypjaParseError(f"Invalid from-import statement: {text}", line=line, col=col)
 
-            if " as " in import_part:
-                name, alias = import_part.split(" as ", 1)
-                names.append((name.strip(), alias.strip()))
-            else:
-                names.append((import_part, None))
+        names = [(m.group(1), m.group(2)) for m in self.NAME_ALIAS_PATTERN.finditer(imports_str)]
 
         return FromImportStatement(module=module, names=names, line=line, col=col)
@@ -1,4 +1,5 @@
 from typja.exceptions import TypjaParseError
+from typja.helpers import split_top_level
 from typja.parser.ast import TypeAnnotation
 
 
@@ -7,9 +8,31 @@ class TypeParser:
     Parse Python-style type annotations
     """
 
+    # Maximum number of parsed type strings kept for reuse
+    CACHE_SIZE = 4096
+
+    def __init__(self) -> None:
+        # Annotations are never mutated after parsing, so one instance is shared by every use of a type string
+        self._cache: dict[str, TypeAnnotation] = {}
+
     def parse_type(self, type_str: str, line: int, col: int) -> TypeAnnotation:
         type_str = type_str.strip()
 
+        cached = self._cache.get(type_str)
+        if cached is not None:
+            return cached
+
+        # Errors aren't cached, so they are always raised with the position of the failing declaration
+        type_annotation = self._parse_type(type_str, line, col)
+
+        if len(self._cache) >= self.CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+        self._cache[type_str] = type_annotation
+
+        return type_annotation
+
+    def _parse_type(self, type_str: str, line: int, col: int) -> TypeAnnotation:
+
         if " | " in type_str:
             return self._parse_union(type_str, line, col)
 
@@ -86,18 +109,15 @@ class TypeParser:
         args_strs = self._split_args(inner)
         args = [self.parse_type(arg, line, col) for arg in args_strs]
 
-        module = None
-        name = base
-        if "." in base:
-            module, name = base.rsplit(".", 1)
+        module, _, name = base.rpartition(".")
 
-        return TypeAnnotation(raw=type_str, name=name, module=module, args=args)
+        return TypeAnnotation(raw=type_str, name=name, module=module or None, args=args)
 
     def _parse_callable(self, base: str, inner: str, raw: str, line: int, col: int) -> TypeAnnotation:
-        if "], " not in inner:
+        args_part, sep, return_part = inner.partition("], ")
+        if not sep:
             raise TypjaParseError(f"Invalid Callable syntax: {raw}", line=line, col=col)
 
-        args_part, return_part = inner.split("], ", 1)
         args_part = args_part.strip()
 
         if not args_part.startswith("["):
@@ -113,38 +133,16 @@ class TypeParser:
 
         all_args = arg_types + [return_type]
 
-        module = None
-        name = base
-        if "." in base:
-            module, name = base.rsplit(".", 1)
+        module, _, name = base.rpartition(".")
 
-        return TypeAnnotation(raw=raw, name=name, module=module, args=all_args)
+        return TypeAnnotation(raw=raw, name=name, module=module or None, args=all_args)
 
     def _parse_qualified(self, type_str: str) -> TypeAnnotation:
-        module, name = type_str.rsplit(".", 1)
+        module, _, name = type_str.rpartition(".")
 
         return TypeAnnotation(raw=type_str, name=name, module=module)
 
     @staticmethod
     def _split_args(args_str: str) -> list[str]:
-        args = []
-        current = []
-        depth = 0
-
-        for char in args_str:
-            if char in "[({":
-                depth += 1
-                current.append(char)
-            elif char in "])}":
-                depth -= 1
-                current.append(char)
-            elif char == "," and depth == 0:
-                args.append("".join(current).strip())
-                current = []
-            else:
-                current.append(char)
-
-        if current:
-            args.append("".join(current).strip())
-
+        args = (arg.strip() for arg in split_top_level(args_str, ","))
         return [arg for arg in args if arg]
@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass
 
 from typja.constants import PYTHON_BUILTINS, TYPING_TYPES
@@ -5,7 +6,7 @@ from typja.exceptions import TypjaValidationError
 from typja.parser.ast import TypeAnnotation
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeDefinition:
     """
     Schema that represents type definition from typja.toml
@@ -22,6 +23,12 @@ class TypeDefinition:
     methods: dict[str, str] | None = None
     module: str | None = None
 
+    def __post_init__(self) -> None:
+        # Matched against the interned names of parsed annotations, interning lets those lookups match by identity
+        self.name = sys.intern(self.name)
+        if self.module is not None:
+            self.module = sys.intern(self.module)
+
     def has_field(self, field_name: str) -> bool:
         """
         Check if type has a field
@@ -62,6 +69,8 @@ class TypeRegistry:
     def __init__(self):
         self._types: dict[str, TypeDefinition] = {}
         self._modules: dict[str, dict[str, TypeDefinition]] = {}
+        # Every type in _modules keyed by (module, name), so a qualified type resolves with one lookup
+        self._qualified: dict[tuple[str, str], TypeDefinition] = {}
         self._imported_names: dict[str, TypeDefinition] = {}
         self._auto_imported_names: dict[str, TypeDefinition] = {}
         self._imported_modules: set[str] = set()
@@ -77,13 +86,22 @@ class TypeRegistry:
                 self._modules[type_def.module] = {}
 
             self._modules[type_def.module][type_def.name] = type_def
+            self._qualified[(type_def.module, type_def.name)] = type_def
 
     def register_module_types(self, module: str, types: dict[str, TypeDefinition]) -> None:
+        module = sys.intern(module)
+
+        previous = self._modules.get(module)
+        if previous is not None:
+            for name in previous:
+                self._qualified.pop((module, name), None)
+
         self._modules[module] = types
 
-        for type_def in types.values():
+        for name, type_def in types.items():
             type_def.module = module
             self._types[type_def.name] = type_def
+            self._qualified[(module, name)] = type_def
 
     def import_module(self, module: str) -> None:
         """
@@ -135,65 +153,67 @@ class TypeRegistry:
             type_annotation (TypeAnnotation): The type annotation to resolve
         """
 
-        if type_annotation.is_union:
+        kind = type_annotation.kind
+
+        if kind == "union":
             if type_annotation.union_types:
                 for union_type in type_annotation.union_types:
                     self.resolve_type(union_type)
 
             return None
 
-        if type_annotation.name in self._builtins:
+        if kind == "builtin":
             return None
 
-        if type_annotation.name in self._typing_types:
-            if type_annotation.module == "typing" or type_annotation.name in self._imported_names:
+        # Read once, every check below looks at the same name and module
+        name = type_annotation.name
+        module = type_annotation.module
+
+        imported_names = self._imported_names
+
+        if kind == "typing":
+            if module == "typing" or name in imported_names:
                 return None
 
             raise TypjaValidationError(
-                f"'{type_annotation.name}' is not defined. "
+                f"'{name}' is not defined. "
                 f"Did you mean to import it from typing?\n"
-                f"\nHint: {{# typja:from typing import {type_annotation.name} #}}"
+                f"\nHint: {{# typja:from typing import {name} #}}"
             )
 
-        # Handle qualified names like 'user.User'
-        if type_annotation.module:
+        # Handle qualified names like 'user.User', which always carry a module
+        if kind == "qualified" and module is not None:
+            type_def = self._qualified.get((module, name))
+            if type_def is not None:
+                return type_def
+
             # For qualified names, check if the module exists in _modules (file-based modules)
-            if type_annotation.module in self._modules:
-                module_types = self._modules[type_annotation.module]
-                if type_annotation.name in module_types:
-                    return module_types[type_annotation.name]
-                else:
-                    raise TypjaValidationError(
-                        f"Module '{type_annotation.module}' has no type '{type_annotation.name}'"
-                    )
+            if module in self._modules:
+                raise TypjaValidationError(f"Module '{module}' has no type '{name}'")
 
             # If module not found, check if it needs to be imported
-            if type_annotation.module not in self._imported_modules:
-                raise TypjaValidationError(
-                    f"Module '{type_annotation.module}' is not imported.\n"
-                    f"\nHint: {{# typja:import {type_annotation.module} #}}"
-                )
-
-            raise TypjaValidationError(f"Module '{type_annotation.module}' not found")
+            if module not in self._imported_modules:
+                raise TypjaValidationError(f"Module '{module}' is not imported.\n\nHint: {{# typja:import {module} #}}")
 
-        if type_annotation.name in self._imported_names:
-            return self._imported_names[type_annotation.name]
+            raise TypjaValidationError(f"Module '{module}' not found")
 
-        if type_annotation.name in self._type_conflicts:
-            conflicting_types = self._type_conflicts[type_annotation.name]
+        # Names imported from typing are stored as None, so membership is checked rather than the value
+        if name in imported_names:
+            return imported_names[name]
 
+        conflicting_types = self._type_conflicts.get(name)
+        if conflicting_types is not None:
             if isinstance(conflicting_types, list) and len(conflicting_types) > 0:
                 if hasattr(conflicting_types[0], "qualified_name"):
                     qualified_names = [rt.qualified_name for rt in conflicting_types]
                     raise TypjaValidationError(
-                        f"Ambiguous type '{type_annotation.name}' found in multiple files.\n"
+                        f"Ambiguous type '{name}' found in multiple files.\n"
                         f"Use qualified name: {', '.join(qualified_names)}\n"
-                        f"Or import explicitly: {{# typja:from <module> import {type_annotation.name} #}}"
+                        f"Or import explicitly: {{# typja:from <module> import {name} #}}"
                     )
 
         raise TypjaValidationError(
-            f"'{type_annotation.name}' is not defined.\n"
-            f"\nHint: Import it with {{# typja:from <module> import {type_annotation.name} #}}"
+            f"'{name}' is not defined.\n\nHint: Import it with {{# typja:from <module> import {name} #}}"
         )
 
     def get_type(self, name: str) -> TypeDefinition | None:
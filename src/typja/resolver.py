@@ -3,6 +3,7 @@ import fnmatch
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from typja.constants import BUILTIN_OR_TYPING
 from typja.registry import TypeDefinition, TypeRegistry
 
 
@@ -387,9 +388,7 @@ class TypeResolver:
         """
 
         # Always allow builtin types
-        from typja.constants import PYTHON_BUILTINS, TYPING_TYPES
-
-        if type_name in PYTHON_BUILTINS or type_name in TYPING_TYPES:
+        if type_name in BUILTIN_OR_TYPING:
             return True
 
         # Handle qualified names
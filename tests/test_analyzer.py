@@ -1,6 +1,12 @@
+import functools
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
 from jinja2 import Environment
 
-from typja.analyzer import TemplateAnalyzer, ValidationIssue
+from typja.analyzer import TemplateAnalyzer, ValidationIssue, ValidationVisitor
 from typja.registry import TypeDefinition, TypeRegistry
 from typja.resolver import ResolvedType, TypeResolver
 
@@ -33,6 +39,13 @@ class TestValidationIssue:
 
         assert issue.hint == "Try this instead"
 
+    def test_validation_issue_is_hashable(self):
+        issue = ValidationIssue(severity="error", message="Test error", filename="test.html", line=1)
+        duplicate = ValidationIssue(severity="error", message="Test error", filename="test.html", line=1)
+
+        assert len({issue, duplicate}) == 1
+        assert not hasattr(issue, "__dict__")
+
 
 class TestTemplateAnalyzer:
 
@@ -50,6 +63,15 @@ class TestTemplateAnalyzer:
 
         assert analyzer.jinja_env == custom_env
 
+    def test_default_environment_is_shared(self):
+        registry = TypeRegistry()
+
+        first = TemplateAnalyzer(registry)
+        second = TemplateAnalyzer(registry)
+
+        assert first.jinja_env is second.jinja_env
+        assert first.jinja_env.autoescape is True
+
     def test_analyze_simple_template(self):
         registry = TypeRegistry()
         analyzer = TemplateAnalyzer(registry)
@@ -138,6 +160,16 @@ class TestTemplateAnalyzer:
 
         assert len(errors) == 0
 
+    def test_analyze_template_without_typja_comments(self):
+        registry = TypeRegistry()
+        analyzer = TemplateAnalyzer(registry)
+
+        template = "<p>{{ name }} {{ user.email }}</p>"
+
+        issues = analyzer.analyze_template(template, "test.html")
+
+        assert issues == []
+
     def test_analyze_template_syntax_error(self):
         registry = TypeRegistry()
         analyzer = TemplateAnalyzer(registry)
@@ -168,6 +200,24 @@ class TestTemplateAnalyzer:
         filter_errors = [e for e in errors if "upper" in e.message.lower()]
         assert len(filter_errors) == 0
 
+    def test_analyze_template_filter_argument_count(self):
+        registry = TypeRegistry()
+        analyzer = TemplateAnalyzer(registry)
+
+        template = """
+{# typja:var name: str #}
+{# typja:filter shout: Callable[[str], str] #}
+<p>{{ name | shout }}</p>
+<p>{{ name | shout(1) }}</p>
+"""
+
+        issues = analyzer.analyze_template(template, "test.html")
+
+        filter_errors = [i for i in issues if "shout" in i.message]
+        assert len(filter_errors) == 1
+        assert filter_errors[0].line == 5
+        assert "expects 1 argument(s) but got 2" in filter_errors[0].message
+
     def test_analyze_template_union_types(self):
         registry = TypeRegistry()
         analyzer = TemplateAnalyzer(registry)
@@ -366,6 +416,21 @@ class TestTemplateAnalyzer:
         assert len(issues1) >= 0
         assert len(issues2) >= 0
 
+    def test_state_does_not_leak_between_templates(self):
+        registry = TypeRegistry()
+        analyzer = TemplateAnalyzer(registry)
+
+        template1 = "{# typja:var name: str #}\n<p>{{ name }} {{ missing }}</p>"
+        template2 = "{# typja:var age: int #}\n<p>{{ name }}</p>"
+
+        issues1 = analyzer.analyze_template(template1, "template1.html")
+        issues2 = analyzer.analyze_template(template2, "template2.html")
+
+        assert [i.filename for i in issues1] == ["template1.html"]
+        assert [i.filename for i in issues2] == ["template2.html"]
+        assert "name" in issues2[0].message
+        assert "name" not in analyzer.variables
+
     def test_loop_variable_attribute_validation(self, tmp_path):
 
         registry = TypeRegistry()
@@ -892,4 +957,303 @@ class User:
         issues = analyzer.analyze_template(content, "test.html")
         
         errors = [issue for issue in issues if issue.severity == "error"]
-        assert len(errors) == 0
\ No newline at end of file
+        assert len(errors) == 0
+
+    def test_parsed_template_is_cached(self, monkeypatch):
+        registry = TypeRegistry()
+        analyzer = TemplateAnalyzer(registry)
+
+        parse_calls = []
+        original_parse = analyzer.jinja_env.parse
+
+        def counting_parse(*args, **kwargs):
+            parse_calls.append(args)
+            return original_parse(*args, **kwargs)
+
+        monkeypatch.setattr(analyzer.jinja_env, "parse", counting_parse)
+
+        template = "{# typja:var name: str #}\n<p>{{ name }}</p>"
+
+        analyzer.analyze_template(template, "test.html")
+        analyzer.analyze_template(template, "test.html")
+        assert len(parse_calls) == 1
+
+        analyzer.analyze_template(template + "\n", "test.html")
+        assert len(parse_calls) == 2
+
+    def test_parse_cache_is_bounded(self, monkeypatch):
+        registry = TypeRegistry()
+        analyzer = TemplateAnalyzer(registry)
+        monkeypatch.setattr(TemplateAnalyzer, "CACHE_SIZE", 2)
+
+        for i in range(5):
+            analyzer.analyze_template(f"{{# typja:var name: str #}}\n<p>{{{{ name }}}} {i}</p>", "test.html")
+
+        assert len(analyzer._ast_cache) == 2
+        assert len(analyzer._comment_cache) == 2
+
+    def test_attribute_validation_is_memoized(self, test_data_dir, monkeypatch):
+        registry = TypeRegistry()
+        resolver = TypeResolver(test_data_dir)
+        resolver.resolve_paths([test_data_dir / "types" / "classes_types.py"])
+        resolver.populate_registry(registry)
+
+        calls = []
+        original_validate = resolver.validate_attribute
+
+        def counting_validate(type_name, attribute):
+            calls.append((type_name, attribute))
+            return original_validate(type_name, attribute)
+
+        monkeypatch.setattr(resolver, "validate_attribute", counting_validate)
+
+        analyzer = TemplateAnalyzer(registry, resolver=resolver)
+
+        template = """
+{# typja:var user: User #}
+<p>{{ user.name }}</p>
+<p>{{ user.name }}</p>
+<p>{{ user.missing }}</p>
+<p>{{ user.missing }}</p>
+"""
+
+        issues = analyzer.analyze_template(template, "test.html")
+
+        assert calls == [("User", "name"), ("User", "missing")]
+        assert len([i for i in issues if "missing" in i.message]) == 2
+
+    def test_analyze_file(self, tmp_path):
+        registry = TypeRegistry()
+        analyzer = TemplateAnalyzer(registry)
+
+        template_path = tmp_path / "page.html"
+        template_path.write_text("{# typja:var name: str #}\n<p>{{ name }} {{ other }}</p>")
+
+        issues = analyzer.analyze_file(template_path)
+
+        assert len(issues) == 1
+        assert issues[0].filename == str(template_path)
+        assert "other" in issues[0].message
+
+    def test_analyze_file_with_crlf_and_cr_line_endings(self, tmp_path):
+        registry = TypeRegistry()
+        analyzer = TemplateAnalyzer(registry)
+
+        template_path = tmp_path / "windows.html"
+        template_path.write_bytes(b"{# typja:var name: str #}\r\r\n<p>{{ other }}</p>\r{{ skipped }} {# typja:ignore #}\r\n")
+
+        issues = analyzer.analyze_file(template_path)
+
+        assert [(issue.line, issue.message) for issue in issues] == [(3, "Variable 'other' is not declared")]
+
+    def test_analyze_files(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("typja.analyzer.os.cpu_count", lambda: 2)
+        registry = TypeRegistry()
+        analyzer = TemplateAnalyzer(registry)
+
+        paths = []
+        for i in range(TemplateAnalyzer.PARALLEL_THRESHOLD + 1):
+            template_path = tmp_path / f"page_{i}.html"
+            template_path.write_text(f"{{# typja:var name: str #}}\n<p>{{{{ name }}}} {{{{ other_{i} }}}}</p>")
+            paths.append(template_path)
+
+        results = analyzer.analyze_files(paths)
+
+        assert list(results) == paths
+        for i, path in enumerate(paths):
+            assert len(results[path]) == 1
+            assert f"other_{i}" in results[path][0].message
+            assert results[path][0].filename == str(path)
+
+    def test_analyze_files_keeps_results_when_pool_breaks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("typja.analyzer.os.cpu_count", lambda: 2)
+        registry = TypeRegistry()
+        analyzer = TemplateAnalyzer(registry)
+
+        paths = []
+        for i in range(TemplateAnalyzer.PARALLEL_THRESHOLD + 1):
+            template_path = tmp_path / f"page_{i}.html"
+            template_path.write_text(f"{{# typja:var name: str #}}\n<p>{{{{ other_{i} }}}}</p>")
+            paths.append(template_path)
+
+        class BreakingPool:
+            def __init__(self, **kwargs):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def map(self, fn, items):
+                yield [ValidationIssue(severity="error", message="from pool", filename=str(items[0]), line=1)]
+                raise BrokenProcessPool("worker died")
+
+        monkeypatch.setattr("typja.analyzer.ProcessPoolExecutor", BreakingPool)
+
+        analyzed = []
+        original_analyze_file = analyzer.analyze_file
+
+        def tracking_analyze_file(path):
+            analyzed.append(path)
+            return original_analyze_file(path)
+
+        monkeypatch.setattr(analyzer, "analyze_file", tracking_analyze_file)
+
+        results = analyzer.analyze_files(paths)
+
+        assert list(results) == paths
+        assert results[paths[0]][0].message == "from pool"
+        assert analyzed == paths[1:]
+
+    def test_analyze_files_falls_back_when_env_cannot_be_pickled(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("typja.analyzer.os.cpu_count", lambda: 2)
+        monkeypatch.setattr(
+            "typja.analyzer.ProcessPoolExecutor",
+            functools.partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")),
+        )
+
+        jinja_env = Environment()
+        jinja_env.globals["lock"] = threading.Lock()
+        analyzer = TemplateAnalyzer(TypeRegistry(), jinja_env=jinja_env)
+
+        paths = []
+        for i in range(TemplateAnalyzer.PARALLEL_THRESHOLD + 1):
+            template_path = tmp_path / f"page_{i}.html"
+            template_path.write_text(f"{{# typja:var name: str #}}\n<p>{{{{ other_{i} }}}}</p>")
+            paths.append(template_path)
+
+        results = analyzer.analyze_files(paths)
+
+        assert list(results) == paths
+        for i, path in enumerate(paths):
+            assert f"other_{i}" in results[path][0].message
+
+    def test_attribute_chain_resolved_once_per_node(self, tmp_path, monkeypatch):
+        (tmp_path / "models.py").write_text(
+            """
+class Address:
+    city: str
+
+class Profile:
+    address: Address
+
+class User:
+    profile: Profile
+"""
+        )
+
+        registry = TypeRegistry()
+        resolver = TypeResolver(tmp_path)
+        resolver.resolve_paths([tmp_path / "models.py"])
+        resolver.populate_registry(registry)
+
+        calls = []
+        original_get_attribute_type = resolver.get_attribute_type
+
+        def counting_get_attribute_type(type_name, attribute):
+            calls.append((type_name, attribute))
+            return original_get_attribute_type(type_name, attribute)
+
+        monkeypatch.setattr(resolver, "get_attribute_type", counting_get_attribute_type)
+
+        analyzer = TemplateAnalyzer(registry, resolver=resolver)
+        issues = analyzer.analyze_template("{# typja:var user: User #}\n<p>{{ user.profile.address.city }}</p>", "test.html")
+
+        assert issues == []
+        assert calls == [("User", "profile"), ("Profile", "address")]
+
+    def test_parse_attribute_type_is_cached(self):
+        registry = TypeRegistry()
+        analyzer = TemplateAnalyzer(registry)
+
+        first = analyzer._parse_attribute_type("list[User]")
+        second = analyzer._parse_attribute_type("list[User]")
+
+        assert first is not None
+        assert first is second
+        assert first.name == "list"
+        assert analyzer._parse_attribute_type("Callable[str]") is None
+
+    def test_column_positions_for_repeated_undeclared_variable(self):
+        registry = TypeRegistry()
+        analyzer = TemplateAnalyzer(registry)
+
+        template = "{# typja:var name: str #}\n<p>{{ missing }} {{ missing }}</p>"
+
+        issues = analyzer.analyze_template(template, "test.html")
+
+        assert [(i.line, i.col, i.end_col) for i in issues] == [(2, 6, 13), (2, 6, 13)]
+        assert analyzer._col_cache == {(2, "missing"): (6, 13)}
+
+    def test_column_positions_with_crlf_line_endings(self):
+        registry = TypeRegistry()
+        analyzer = TemplateAnalyzer(registry)
+
+        template = "{# typja:var name: str #}\r\n<p>{{ name }}</p>\r\n<p>{{ missing }}</p>"
+
+        issues = analyzer.analyze_template(template, "test.html")
+
+        assert [(i.line, i.col, i.end_col) for i in issues] == [(3, 6, 13)]
+
+    def test_line_offsets_not_computed_without_issues(self):
+        registry = TypeRegistry()
+        analyzer = TemplateAnalyzer(registry)
+
+        issues = analyzer.analyze_template("{# typja:var name: str #}\n{{ name }}", "test.html")
+
+        assert issues == []
+        assert analyzer._line_starts is None
+
+    def test_nested_nodes_are_visited_in_source_order(self):
+        registry = TypeRegistry()
+        analyzer = TemplateAnalyzer(registry)
+
+        template = """{# typja:var name: str #}
+{% if name %}
+  {% set greeting = first ~ (second if name else third) %}
+  <p>{{ [fourth, {"k": fifth}] }}</p>
+{% endif %}"""
+
+        issues = analyzer.analyze_template(template, "test.html")
+
+        undeclared = [i.message.split("'")[1] for i in issues]
+        assert undeclared == ["first", "second", "third", "fourth", "fifth"]
+
+    def test_for_loop_visits_each_name_once(self, monkeypatch):
+        registry = TypeRegistry()
+        analyzer = TemplateAnalyzer(registry)
+
+        visited: list[str] = []
+        original = ValidationVisitor.visit_Name
+
+        def tracking_visit_name(self, node):
+            visited.append(node.name)
+            original(self, node)
+
+        monkeypatch.setattr(ValidationVisitor, "visit_Name", tracking_visit_name)
+
+        template = """{# typja:var names: list[str] #}
+{% for name in names if name %}{{ name }}{% else %}{{ names }}{% endfor %}
+{% for item in missing %}{% endfor %}"""
+
+        issues = analyzer.analyze_template(template, "test.html")
+
+        assert visited == ["names", "name", "name", "names", "missing"]
+        assert [i.message for i in issues] == ["Variable 'missing' is not declared"]
+
+    def test_analyze_declarations_only_skips_jinja_parse(self):
+        registry = TypeRegistry()
+        analyzer = TemplateAnalyzer(registry)
+
+        template = """{# typja:var name: str #}
+{# typja:macro button(label: str) -> str #}
+{% if name %}{{ missing }}"""
+
+        issues = analyzer.analyze_declarations_only(template, "test.html")
+
+        assert issues == []
+        assert set(analyzer.variables) == {"name"}
+        assert set(analyzer.macros) == {"button"}
+        assert not analyzer._ast_cache
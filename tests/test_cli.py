@@ -1,9 +1,23 @@
+import functools
+import importlib
+import multiprocessing
+import os
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import SimpleNamespace
 from unittest.mock import patch
 
+import pytest
+from jinja2 import Environment
 from typer.testing import CliRunner
 
+from typja.analyzer import TemplateAnalyzer, ValidationIssue
 from typja.cli.app import app
+from typja.cli.check import Checker, _check_content, _resolve_jinja_env, build_checker
+from typja.config import TypjaConfig
+from typja.exceptions import TypjaConfigError
 
 runner = CliRunner()
 
@@ -344,6 +358,207 @@ template_dirs = ["templates"]
         assert result.exit_code == 0
 
 
+class TestChecker:
+
+    def test_fix_skips_templates_without_fixable_issues(self, tmp_path, monkeypatch):
+        clean = tmp_path / "clean.html"
+        clean.write_text("{# typja:var name: str #}\n<p>{{ name }} {{ missing }}</p>\n")
+        union = tmp_path / "union.html"
+        union.write_text("{# typja:from typing import Optional #}\n{# typja:var name: Optional[str] #}\n<p>{{ name }}</p>\n")
+
+        monkeypatch.chdir(tmp_path)
+        checker = Checker(TypjaConfig())
+
+        fixed = []
+        original_auto_fix = checker.linter.auto_fix
+
+        def recording_auto_fix(content, issues):
+            fixed.append(content)
+            return original_auto_fix(content, issues)
+
+        monkeypatch.setattr(checker.linter, "auto_fix", recording_auto_fix)
+
+        original = union.read_text()
+        checker.check_paths([clean, union], fix=True)
+
+        assert fixed == [original]
+        assert "str | None" in union.read_text()
+
+    def test_unchanged_templates_reuse_results(self, tmp_path, monkeypatch):
+        template = tmp_path / "test.html"
+        template.write_text("{# typja:var name: str #}\n<p>{{ name }} {{ missing }}</p>\n")
+
+        checker = Checker(TypjaConfig())
+
+        analyzed = []
+        original_analyze = TemplateAnalyzer.analyze_template
+
+        def counting_analyze(self, content, filename="<unknown>"):
+            analyzed.append(filename)
+            return original_analyze(self, content, filename)
+
+        monkeypatch.setattr(TemplateAnalyzer, "analyze_template", counting_analyze)
+
+        first = checker.check_paths([template])
+        second = checker.check_paths([template])
+
+        assert len(analyzed) == 1
+        assert first == second
+        assert [i.message for i in first] == ["Variable 'missing' is not declared"]
+
+        template.write_text("{# typja:var name: str #}\n<p>{{ name }}</p>\n")
+        assert checker.check_paths([template]) == []
+        assert len(analyzed) == 2
+
+        checker.reload_types()
+        checker.check_paths([template])
+        assert len(analyzed) == 3
+
+    def test_one_analyzer_checks_every_template(self, tmp_path, monkeypatch):
+        templates = []
+        for i in range(2):
+            template = tmp_path / f"page_{i}.html"
+            template.write_text(f"{{# typja:var name: str #}}\n<p>{{{{ other_{i} }}}}</p>\n")
+            templates.append(template)
+
+        checker = Checker(TypjaConfig())
+
+        created = []
+        original_init = TemplateAnalyzer.__init__
+
+        def tracking_init(self, *args, **kwargs):
+            created.append(self)
+            original_init(self, *args, **kwargs)
+
+        monkeypatch.setattr(TemplateAnalyzer, "__init__", tracking_init)
+
+        issues = checker.check_paths(templates)
+
+        assert created == []
+        assert [i.message for i in issues] == [
+            "Variable 'other_0' is not declared",
+            "Variable 'other_1' is not declared",
+        ]
+
+    def test_check_paths_in_parallel(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("typja.cli.check.os.cpu_count", lambda: 2)
+
+        templates = []
+        for i in range(TemplateAnalyzer.PARALLEL_THRESHOLD + 1):
+            template = tmp_path / f"page_{i}.html"
+            template.write_text(f"{{# typja:var name: str #}}\n<p>{{{{ name }}}} {{{{ other_{i} }}}}</p>\n")
+            templates.append(template)
+
+        checker = Checker(TypjaConfig())
+        issues = checker.check_paths(templates)
+
+        assert [(i.filename, i.message) for i in issues] == [
+            (str(template), f"Variable 'other_{n}' is not declared") for n, template in enumerate(templates)
+        ]
+        assert len(checker._results_cache) == len(templates)
+
+    def test_check_paths_keeps_results_when_pool_breaks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("typja.cli.check.os.cpu_count", lambda: 2)
+
+        templates = []
+        for i in range(TemplateAnalyzer.PARALLEL_THRESHOLD + 1):
+            template = tmp_path / f"page_{i}.html"
+            template.write_text(f"{{# typja:var name: str #}}\n<p>{{{{ other_{i} }}}}</p>\n")
+            templates.append(template)
+
+        class BreakingPool:
+            def __init__(self, **kwargs):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def map(self, fn, tasks, chunksize=1):
+                issue = ValidationIssue(severity="error", message="from pool", filename=tasks[0][0], line=1)
+                yield (issue,), ()
+                raise BrokenProcessPool("worker died")
+
+        monkeypatch.setattr("typja.cli.check.ProcessPoolExecutor", BreakingPool)
+
+        checked = []
+
+        def tracking_check_content(analyzer, linter, lint_config, filename, content):
+            checked.append(filename)
+            return _check_content(analyzer, linter, lint_config, filename, content)
+
+        monkeypatch.setattr("typja.cli.check._check_content", tracking_check_content)
+
+        checker = Checker(TypjaConfig())
+        issues = checker.check_paths(templates)
+
+        assert checked == [str(template) for template in templates[1:]]
+        assert [i.message for i in issues] == ["from pool"] + [
+            f"Variable 'other_{n}' is not declared" for n in range(1, len(templates))
+        ]
+
+    def test_check_paths_falls_back_when_env_cannot_be_pickled(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("typja.cli.check.os.cpu_count", lambda: 2)
+        monkeypatch.setattr(
+            "typja.cli.check.ProcessPoolExecutor",
+            functools.partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")),
+        )
+
+        templates = []
+        for i in range(TemplateAnalyzer.PARALLEL_THRESHOLD + 1):
+            template = tmp_path / f"page_{i}.html"
+            template.write_text(f"{{# typja:var name: str #}}\n<p>{{{{ other_{i} }}}}</p>\n")
+            templates.append(template)
+
+        jinja_env = Environment()
+        jinja_env.globals["lock"] = threading.Lock()
+        checker = Checker(TypjaConfig(), jinja_env=jinja_env)
+
+        issues = checker.check_paths(templates)
+
+        assert [i.message for i in issues] == [
+            f"Variable 'other_{n}' is not declared" for n in range(len(templates))
+        ]
+
+    def test_check_paths_reports_unreadable_templates(self, tmp_path, capsys):
+        readable = tmp_path / "readable.html"
+        readable.write_text("{# typja:var name: str #}\n<p>{{ missing }}</p>\n")
+        missing = tmp_path / "missing.html"
+
+        checker = Checker(TypjaConfig())
+        issues = checker.check_paths([missing, readable])
+
+        assert [i.filename for i in issues] == [str(readable)]
+        assert "Error analyzing" in capsys.readouterr().out
+
+    def test_jinja_env_resolution_is_memoized(self, tmp_path, monkeypatch):
+        (tmp_path / "typja_test_env_module.py").write_text("from jinja2 import Environment\nenv = Environment()\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        imports = []
+        original_import = importlib.import_module
+
+        def counting_import(name, *args):
+            imports.append(name)
+            return original_import(name, *args)
+
+        monkeypatch.setattr("typja.cli.check.importlib.import_module", counting_import)
+
+        config = TypjaConfig()
+        config.environment.jinja_env = "typja_test_env_module:env"
+
+        first = build_checker(config)
+        second = build_checker(config)
+
+        assert first.jinja_env is second.jinja_env
+        assert imports == ["typja_test_env_module"]
+
+        with pytest.raises(TypjaConfigError):
+            _resolve_jinja_env("typja_test_env_module:missing")
+
+
 class TestCLIWatchCommand:
 
     def test_watch_without_config(self, tmp_path):
@@ -428,6 +643,161 @@ template_dirs = ["templates"]
 
         assert result.exit_code == 0
 
+    @patch("typja.cli.watch.time.sleep")
+    def test_watch_uses_file_events(self, mock_sleep, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+
+        template = templates_dir / "test.html"
+        template.write_text("{# typja:var name: str #}\n<p>{{ name }}</p>\n")
+
+        config = tmp_path / "typja.toml"
+        config.write_text(
+            """
+[project]
+root = "."
+
+[environment]
+template_dirs = ["templates"]
+"""
+        )
+
+        scheduled = []
+
+        class FakeObserver:
+            def schedule(self, handler, path, recursive):
+                scheduled.append((path, recursive))
+                self.handler = handler
+
+            def start(self):
+                for changed in (template, templates_dir / "notes.txt"):
+                    self.handler.dispatch(SimpleNamespace(is_directory=False, src_path=str(changed), dest_path=""))
+
+            def stop(self):
+                pass
+
+            def join(self):
+                pass
+
+        mock_sleep.side_effect = [None, None, KeyboardInterrupt()]
+
+        with patch("typja.cli.watch.Observer", FakeObserver):
+            result = runner.invoke(app, ["watch", "--root", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert (str(templates_dir.resolve()), True) in scheduled
+        assert "Detected changes in 1 file(s)" in result.stdout
+
+    @patch("typja.cli.watch.time.sleep")
+    def test_watch_debounces_event_bursts(self, mock_sleep, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+
+        first = templates_dir / "first.html"
+        second = templates_dir / "second.html"
+        for template in (first, second):
+            template.write_text("{# typja:var name: str #}\n<p>{{ name }}</p>\n")
+
+        (tmp_path / "typja.toml").write_text('[project]\nroot = "."\n\n[environment]\ntemplate_dirs = ["templates"]\n')
+
+        handlers = []
+
+        class FakeObserver:
+            def schedule(self, handler, path, recursive):
+                handlers.append(handler)
+
+            def start(self):
+                pass
+
+            def stop(self):
+                pass
+
+            def join(self):
+                pass
+
+        def dispatch(path):
+            handlers[0].dispatch(SimpleNamespace(is_directory=False, src_path=str(path), dest_path=""))
+
+        # Events keep arriving over two debounce windows, then stop for one
+        def side_effect_sleep(*args):
+            if mock_sleep.call_count == 1:
+                dispatch(first)
+            elif mock_sleep.call_count == 2:
+                dispatch(second)
+            elif mock_sleep.call_count > 4:
+                raise KeyboardInterrupt()
+
+        mock_sleep.side_effect = side_effect_sleep
+
+        with patch("typja.cli.watch.Observer", FakeObserver):
+            result = runner.invoke(app, ["watch", "--root", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert result.stdout.count("Detected changes") == 1
+        assert "Detected changes in 2 file(s)" in result.stdout
+
+    @patch("typja.cli.watch.time.sleep")
+    def test_watch_rechecks_only_changed_templates(self, mock_sleep, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+
+        changed = templates_dir / "changed.html"
+        for template in (changed, templates_dir / "other.html"):
+            template.write_text("{# typja:var name: str #}\n<p>{{ name }}</p>\n")
+
+        (tmp_path / "typja.toml").write_text('[project]\nroot = "."\n\n[environment]\ntemplate_dirs = ["templates"]\n')
+
+        def side_effect_sleep(*args):
+            if mock_sleep.call_count == 1:
+                changed.write_text("{# typja:var name: str #}\n<p>{{ name }} modified</p>\n")
+                mtime = changed.stat().st_mtime + 1
+                os.utime(changed, (mtime, mtime))
+            else:
+                raise KeyboardInterrupt()
+
+        mock_sleep.side_effect = side_effect_sleep
+
+        with patch("typja.cli.watch.Observer", None):
+            result = runner.invoke(app, ["watch", "--root", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "Checking 2 template(s)" in result.stdout
+        assert "Checking 1 template(s)" in result.stdout
+
+    @patch("typja.cli.watch.time.sleep")
+    def test_watch_detects_deleted_files(self, mock_sleep, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+
+        deleted = templates_dir / "deleted.html"
+        for template in (deleted, templates_dir / "kept.html"):
+            template.write_text("{# typja:var name: str #}\n<p>{{ name }}</p>\n")
+
+        (tmp_path / "typja.toml").write_text('[project]\nroot = "."\n\n[environment]\ntemplate_dirs = ["templates"]\n')
+
+        def side_effect_sleep(*args):
+            if mock_sleep.call_count == 1:
+                deleted.unlink()
+            elif mock_sleep.call_count > 2:
+                raise KeyboardInterrupt()
+
+        mock_sleep.side_effect = side_effect_sleep
+
+        with patch("typja.cli.watch.Observer", None):
+            result = runner.invoke(app, ["watch", "--root", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert result.stdout.count("Detected changes in 1 file(s)") == 1
+        assert "deleted.html" in result.stdout
+
     def test_watch_with_nonexistent_template_dir(self, tmp_path):
         """Test watch handles nonexistent template directories"""
         config = tmp_path / "typja.toml"
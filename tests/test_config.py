@@ -78,6 +78,46 @@ class TestConfigSchema:
         assert config.environment.jinja_env is None
         assert config.linting.strict is False
 
+    def test_config_sections_use_slots(self):
+        config = TypjaConfig()
+
+        for section in (config, config.project, config.environment, config.linting, config.formatting, config.errors):
+            assert not hasattr(section, "__dict__")
+
+        with pytest.raises(AttributeError):
+            config.project.unknown_option = True
+
+    def test_template_dir_paths(self):
+        config = TypjaConfig(
+            project=ProjectConfig(root="./app"),
+            environment=EnvironmentConfig(template_dirs=["templates", "emails"]),
+        )
+
+        assert config.template_dir_paths == (Path("app/templates"), Path("app/emails"))
+        assert config.template_dir_paths is config.template_dir_paths
+        assert config.get_template_dirs() == list(config.template_dir_paths)
+
+        config.project.root = "./site"
+        assert config.template_dir_paths == (Path("site/templates"), Path("site/emails"))
+
+    def test_get_type_paths_deduplicates_overlapping_patterns(self, tmp_path):
+        types_dir = tmp_path / "types"
+        types_dir.mkdir()
+        (types_dir / "models.py").write_text("class User: ...\n")
+        (types_dir / "forms.py").write_text("class Form: ...\n")
+
+        config = TypjaConfig(
+            project=ProjectConfig(
+                root=str(tmp_path),
+                paths=["types/models.py", "types/*.py", "types/**/*.py", "types/*.py", "missing.py"],
+            )
+        )
+
+        paths = config.get_type_paths()
+
+        assert paths[0] == types_dir / "models.py"
+        assert sorted(paths) == [types_dir / "forms.py", types_dir / "models.py"]
+
 
 class TestConfigLoader:
 
@@ -110,6 +150,56 @@ class TestConfigLoader:
         with pytest.raises(TypjaConfigError):
             ConfigLoader.load("/path/that/does/not/exist.toml")
 
+    def test_load_reuses_parsed_config_until_file_changes(self, tmp_path, monkeypatch):
+        config_path = tmp_path / "typja.toml"
+        config_path.write_text('[project]\nroot = "."\n')
+
+        parses = []
+        original_parse = ConfigLoader.parse_config
+
+        def counting_parse(data):
+            parses.append(data)
+            return original_parse(data)
+
+        monkeypatch.setattr(ConfigLoader, "parse_config", staticmethod(counting_parse))
+
+        first = ConfigLoader.load(config_path)
+        first.project.fail_on_warning = True
+        second = ConfigLoader.load(config_path)
+
+        assert len(parses) == 1
+        assert second.project.fail_on_warning is False
+
+        config_path.write_text('[project]\nroot = "./app"\n')
+        third = ConfigLoader.load(config_path)
+
+        assert len(parses) == 2
+        assert third.project.root == "./app"
+
+    def test_load_uses_rtoml_when_installed(self, tmp_path, monkeypatch):
+        import typja.config.loader as loader
+
+        config_path = tmp_path / "typja.toml"
+        config_path.write_text('[project]\nroot = "./app"\n')
+
+        loaded = []
+
+        class FakeRtoml:
+            @staticmethod
+            def load(path):
+                loaded.append(path)
+                return {"project": {"root": "./native"}}
+
+        monkeypatch.setattr(loader, "rtoml", FakeRtoml)
+
+        assert ConfigLoader.load(config_path).project.root == "./native"
+        assert loaded == [config_path]
+
+        monkeypatch.setattr(loader, "rtoml", None)
+        config_path.write_text('[project]\nroot = "./app"\n\n')
+
+        assert ConfigLoader.load(config_path).project.root == "./app"
+
     def test_load_invalid_syntax_config(self, configs_dir):
         invalid_config = configs_dir / "invalid_syntax.toml"
         with pytest.raises(TypjaConfigError):
@@ -142,6 +232,36 @@ root = "."
         found = ConfigLoader.find_config(subdir)
         assert found == config_path
 
+    def test_find_config_rechecks_removed_config(self, tmp_path):
+        outer_config = tmp_path / "typja.toml"
+        outer_config.write_text('[project]\nroot = "."\n')
+
+        project = tmp_path / "project"
+        project.mkdir()
+        inner_config = project / "typja.toml"
+        inner_config.write_text('[project]\nroot = "."\n')
+
+        assert ConfigLoader.find_config(project) == inner_config
+        assert ConfigLoader.find_config(project) == inner_config
+
+        inner_config.unlink()
+
+        assert ConfigLoader.find_config(project) == outer_config
+
+    def test_find_config_picks_up_new_nearer_config(self, tmp_path):
+        outer_config = tmp_path / "typja.toml"
+        outer_config.write_text('[project]\nroot = "."\n')
+
+        project = tmp_path / "project"
+        project.mkdir()
+
+        assert ConfigLoader.find_config(project) == outer_config
+
+        inner_config = project / "typja.toml"
+        inner_config.write_text('[project]\nroot = "."\n')
+
+        assert ConfigLoader.find_config(project) == inner_config
+
     def test_find_config_not_found(self, tmp_path):
 
         with pytest.raises(TypjaConfigError) as exc_info:
@@ -1,4 +1,13 @@
-from typja.helpers import find_templates
+import os
+
+from typja.helpers import (
+    compile_exclude_patterns,
+    compile_include_patterns,
+    find_templates,
+    find_templates_multi,
+    read_template,
+    split_top_level,
+)
 
 
 class TestFindTemplates:
@@ -232,3 +241,131 @@ class TestFindTemplates:
 
         assert len(found) > 0
         assert any(f.name == "simple_vars.html" for f in found)
+
+    def test_find_templates_skips_excluded_directories(self, tmp_path, monkeypatch):
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "vendor.html").write_text("<html></html>")
+        (tmp_path / "index.html").write_text("<html></html>")
+
+        scanned = []
+        original_scandir = os.scandir
+
+        def tracking_scandir(path):
+            scanned.append(os.path.relpath(path, tmp_path))
+            return original_scandir(path)
+
+        monkeypatch.setattr("typja.helpers.os.scandir", tracking_scandir)
+
+        found = find_templates(tmp_path, include_patterns=["*.html", "*.jinja"], exclude_patterns=["**/node_modules/**"])
+
+        assert found == [tmp_path / "index.html"]
+        assert scanned == ["."]
+
+    def test_find_templates_recursive_include_pattern(self, tmp_path):
+        (tmp_path / "emails" / "nested").mkdir(parents=True)
+        (tmp_path / "index.html").write_text("<html></html>")
+        (tmp_path / "emails" / "welcome.html").write_text("<html></html>")
+        (tmp_path / "emails" / "nested" / "reset.html").write_text("<html></html>")
+
+        assert find_templates(tmp_path, ["**/*.html"], []) == sorted(tmp_path.rglob("*.html"))
+        assert find_templates(tmp_path, ["emails/**/*.html"], []) == [
+            tmp_path / "emails" / "nested" / "reset.html",
+            tmp_path / "emails" / "welcome.html",
+        ]
+
+    def test_find_templates_multi_skips_nested_roots(self, tmp_path, monkeypatch):
+        templates_dir = tmp_path / "templates"
+        emails_dir = templates_dir / "emails"
+        other_dir = tmp_path / "other"
+        emails_dir.mkdir(parents=True)
+        other_dir.mkdir()
+
+        (templates_dir / "index.html").write_text("<html></html>")
+        (emails_dir / "welcome.html").write_text("<html></html>")
+        (other_dir / "page.html").write_text("<html></html>")
+
+        walked = []
+        original_find = find_templates
+
+        def tracking_find(root, include_patterns, exclude_patterns):
+            walked.append(root)
+            return original_find(root, include_patterns, exclude_patterns)
+
+        monkeypatch.setattr("typja.helpers.find_templates", tracking_find)
+
+        found = find_templates_multi(
+            [templates_dir, emails_dir, other_dir, tmp_path / "missing", templates_dir],
+            include_patterns=["*.html"],
+            exclude_patterns=[],
+        )
+
+        assert sorted(walked) == [other_dir, templates_dir]
+        assert found == sorted(
+            [templates_dir / "index.html", emails_dir / "welcome.html", other_dir / "page.html"]
+        )
+
+
+class TestCompilePatterns:
+
+    def test_include_patterns_follow_path_match(self):
+        regex = compile_include_patterns(("*.html", "./emails/*.j2"))
+
+        assert regex.search("index.html")
+        assert regex.search("nested/dir/index.html")
+        assert regex.search("site/emails/welcome.j2")
+        assert not regex.search("welcome.j2")
+        assert not regex.search("index.htm")
+
+    def test_exclude_patterns(self):
+        regex = compile_exclude_patterns(("**/node_modules/**", "wheels/**", "[!a]*.tmp.html"))
+
+        assert regex.search("node_modules/x.html")
+        assert regex.search("app/node_modules/pkg/x.html")
+        assert not regex.search("app/node_modules_x/x.html")
+        assert regex.search("wheels/x.html")
+        assert not regex.search("wheels/nested/x.html")
+        assert regex.search("b.tmp.html")
+        assert not regex.search("a.tmp.html")
+
+    def test_empty_patterns_match_nothing(self):
+        assert not compile_exclude_patterns(()).search("index.html")
+        assert compile_exclude_patterns(("*.html",)) is compile_exclude_patterns(("*.html",))
+
+
+class TestReadTemplate:
+
+    def test_read_template(self, tmp_path):
+        template = tmp_path / "index.html"
+        template.write_text("{# typja:var name: str #}\n<p>{{ name }} – ✓</p>\n", encoding="utf-8")
+
+        assert read_template(template) == "{# typja:var name: str #}\n<p>{{ name }} – ✓</p>\n"
+
+    def test_read_template_normalizes_line_endings(self, tmp_path):
+        template = tmp_path / "windows.html"
+        template.write_bytes(b"{# typja:var name: str #}\r\n<p>{{ name }}</p>\r<p>old mac</p>\r\n")
+
+        assert read_template(template) == "{# typja:var name: str #}\n<p>{{ name }}</p>\n<p>old mac</p>\n"
+
+    def test_read_empty_template(self, tmp_path):
+        template = tmp_path / "empty.html"
+        template.write_text("")
+
+        assert read_template(template) == ""
+
+
+class TestSplitTopLevel:
+
+    def test_split_ignores_nested_delimiters(self):
+        assert split_top_level("str, dict[str, int], Callable[[int], str]") == [
+            "str",
+            " dict[str, int]",
+            " Callable[[int], str]",
+        ]
+
+    def test_split_on_other_delimiters(self):
+        assert split_top_level("a: int = f(1, 2)", "=") == ["a: int ", " f(1, 2)"]
+
+    def test_split_edges(self):
+        assert split_top_level("") == []
+        assert split_top_level("a,") == ["a"]
+        assert split_top_level(",a,,b") == ["", "a", "", "b"]
@@ -382,3 +382,189 @@ class TestLinter:
         errors = [i for i in issues_error if i.severity == "error"]
 
         assert len(warnings) > 0 or len(errors) > 0
+
+    def test_is_fixable(self):
+
+        linter = Linter()
+        template = """
+{# typja:from typing import Union #}
+{# typja:var value: Union[str, int] #}
+{# typja:var value: str #}
+<p>{{ value }}</p>
+"""
+
+        issues = linter.lint_template(template, "test.html", {})
+
+        fixable = [i for i in issues if Linter.is_fixable(i)]
+        assert len(fixable) == 1
+        assert "Use PEP 604" in fixable[0].message
+        assert any(not Linter.is_fixable(i) for i in issues)
+
+        fixed = linter.auto_fix(template, issues)
+        assert fixed == linter.auto_fix(template, fixable)
+        assert "str | int" in fixed
+
+    def test_comments_parsed_only_for_enabled_comment_rules(self, monkeypatch):
+
+        linter = Linter()
+        parsed = []
+        original_parse = linter.comment_parser.parse_template
+
+        def counting_parse(content, filename="<unknown>"):
+            parsed.append(filename)
+            return original_parse(content, filename)
+
+        monkeypatch.setattr(linter.comment_parser, "parse_template", counting_parse)
+        monkeypatch.setattr(linter, "rules", [r for r in linter.rules if r.name == "prefer-pep604-union"])
+
+        template = "{# typja:var value: Optional[str] #}\n"
+        issues = linter.lint_template(template, "test.html", {})
+
+        assert parsed == []
+        assert len(issues) == 1
+
+        linter.lint_template(template, "test.html", {"linting": {"prefer_pep604_unions": False}})
+        assert parsed == []
+
+    def test_unused_imports_with_dotted_modules(self):
+
+        linter = Linter()
+        template = """
+{# typja:import os.path #}
+{# typja:import datetime #}
+{# typja:import models #}
+{# typja:from typing import Any, Optional as Opt #}
+{# typja:var joined: os.path.Joined #}
+{# typja:var value: Any #}
+<p>{{ joined }} {{ value }} {{ models }}</p>
+"""
+
+        issues = linter.lint_template(template, "test.html", {})
+        unused = sorted(i.message for i in issues if "unused" in i.message.lower())
+
+        assert unused == [
+            "Import 'Optional' from 'typing' is unused",
+            "Import 'datetime' is unused",
+            "Import 'models' is unused",
+        ]
+
+    def test_lint_results_cached_for_unchanged_content(self, monkeypatch):
+
+        linter = Linter()
+        linted = []
+        original_lint = linter._lint
+
+        def counting_lint(content, filename, enabled, digest):
+            linted.append(filename)
+            return original_lint(content, filename, enabled, digest)
+
+        monkeypatch.setattr(linter, "_lint", counting_lint)
+
+        template = "{# typja:var value: Optional[str] #}\n"
+        first = linter.lint_template(template, "test.html", {})
+        first.clear()
+        second = linter.lint_template(template, "test.html", {})
+
+        assert len(linted) == 1
+        assert len(second) == 1
+
+        linter.lint_template(template, "other.html", {})
+        linter.lint_template(template, "test.html", {"linting": {"union_style": "error"}})
+        linter.lint_template(template + "\n", "test.html", {})
+
+        assert len(linted) == 4
+
+    def test_auto_fix_keeps_line_endings(self):
+
+        linter = Linter()
+        template = (
+            "{# typja:from typing import Optional, Union #}\r\n"
+            "{# typja:var a: Optional[str] #}\r\n"
+            "{# typja:var b: Union[int, str] #}\r\n"
+        )
+
+        issues = linter.lint_template(template, "test.html", {})
+        fixed = linter.auto_fix(template, issues)
+
+        assert fixed == (
+            "{# typja:from typing import Optional, Union #}\r\n"
+            "{# typja:var a: str | None #}\r\n"
+            "{# typja:var b: int | str #}\r\n"
+        )
+        assert linter.auto_fix(template, []) is template
+
+    def test_enabled_rules_resolved_once_per_config(self, monkeypatch):
+
+        linter = Linter()
+        resolved = []
+        original_resolve = linter._resolve_enabled_rules
+
+        def counting_resolve(rule_config):
+            resolved.append(rule_config)
+            return original_resolve(rule_config)
+
+        monkeypatch.setattr(linter, "_resolve_enabled_rules", counting_resolve)
+
+        linter.lint_template("<p>one</p>", "one.html", {})
+        linter.lint_template("<p>two</p>", "two.html", {})
+        issues = linter.lint_template(
+            "{# typja:var value: Optional[str] #}\n", "three.html", {"linting": {"prefer_pep604_unions": False}}
+        )
+
+        assert resolved == [{}, {"prefer_pep604_unions": False}]
+        assert issues == []
+
+    def test_redundant_none_in_each_declaration_kind(self):
+
+        linter = Linter()
+        template = """
+{# typja:var value: str | None | None #}
+{# typja:filter shout: (str) -> str #}
+{# typja:macro card(title: int | None | None, body: str) -> str | None | None #}
+{# typja:var ok: str | None #}
+"""
+
+        issues = linter.lint_template(template, "test.html", {})
+        lines = [i.line for i in issues if i.message == "Redundant None in union type"]
+
+        assert lines == [2, 4, 4]
+
+    def test_check_redundant_none(self):
+
+        linter = Linter()
+
+        assert linter._check_redundant_none("str")
+        assert linter._check_redundant_none("str | None")
+        assert not linter._check_redundant_none("None | str | None")
+        assert not linter._check_redundant_none("None|None")
+
+    def test_import_block_sorted(self):
+
+        linter = Linter()
+
+        assert linter._check_import_block_sorted([(1, "a", ""), (2, "a", ""), (3, "b", "")], "test.html", "warning") == []
+
+        issues = linter._check_import_block_sorted([(4, "b", ""), (5, "a", "")], "test.html", "warning")
+        assert [(i.line, i.message) for i in issues] == [(4, "Imports should be sorted alphabetically")]
+
+    def test_comments_parsed_once_across_configs(self, monkeypatch):
+
+        linter = Linter()
+        parsed = []
+        original_parse = linter.comment_parser.parse_template
+
+        def counting_parse(content, filename="<unknown>"):
+            parsed.append(filename)
+            return original_parse(content, filename)
+
+        monkeypatch.setattr(linter.comment_parser, "parse_template", counting_parse)
+
+        template = "{# typja:from typing import Any #}\n"
+        first = linter.lint_template(template, "test.html", {})
+        second = linter.lint_template(template, "test.html", {"linting": {"union_style": "error"}})
+
+        assert parsed == ["test.html"]
+        assert first == second
+
+        linter.lint_template(template, "other.html", {})
+        assert parsed == ["test.html", "other.html"]
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from typja.exceptions import TypjaParseError
@@ -55,6 +57,36 @@ class TestParserAST:
         assert ta.union_types is not None
         assert len(ta.union_types) == 2
 
+    def test_type_annotation_str_is_cached(self):
+        str_arg = TypeAnnotation(raw="str", name="str", module=None)
+        ta = TypeAnnotation(raw="list[str]", name="list", module=None, args=[str_arg])
+
+        with patch.object(TypeAnnotation, "_format", autospec=True, side_effect=TypeAnnotation._format) as fmt:
+            assert str(ta) == "list[str]"
+            assert str(ta) == "list[str]"
+
+        assert fmt.call_count == 2  # once for the list, once for its argument
+        assert ta == TypeAnnotation(raw="list[str]", name="list", module=None, args=[str_arg])
+
+    def test_type_annotation_kind(self):
+        parser = TypeParser()
+
+        assert parser.parse_type("str | None", 1, 0).kind == "union"
+        assert parser.parse_type("Optional[int]", 1, 0).kind == "union"
+        assert parser.parse_type("list[str]", 1, 0).kind == "builtin"
+        assert parser.parse_type("Callable[[], str]", 1, 0).kind == "typing"
+        assert parser.parse_type("typing.Any", 1, 0).kind == "typing"
+        assert parser.parse_type("models.User", 1, 0).kind == "qualified"
+        assert parser.parse_type("User", 1, 0).kind == "name"
+
+    def test_ast_nodes_use_slots(self):
+        parser = CommentParser()
+        comments = parser.parse_template("{# typja:macro card(title: str | None) -> str #}")
+        macro = comments[0].declarations[0]
+
+        for node in (comments[0], macro, macro.return_type, macro.params[0][1].union_types[0]):
+            assert not hasattr(node, "__dict__")
+
     def test_import_statement(self):
 
         stmt = ImportStatement(module="datetime", line=1, col=0)
@@ -152,6 +184,14 @@ class TestParserTypes:
         assert ta.union_types[0].name == "str"
         assert ta.union_types[1].name == "int"
 
+    def test_parse_union_flat_types(self):
+        parser = TypeParser()
+        union = parser.parse_type("str | list[int]", 1, 0)
+        assert union.flat_types == tuple(union.union_types)
+
+        single = parser.parse_type("list[int]", 1, 0)
+        assert single.flat_types == (single,)
+
     def test_parse_union_old_style(self):
         parser = TypeParser()
         ta = parser.parse_type("Union[str, int]", 1, 0)
@@ -214,6 +254,21 @@ class TestParserTypes:
         with pytest.raises(TypjaParseError):
             parser.parse_type("List[str", 1, 0)
 
+    def test_parse_type_reuses_parsed_types(self):
+        parser = TypeParser()
+
+        first = parser.parse_type("dict[str, list[int]]", 1, 0)
+        assert parser.parse_type(" dict[str, list[int]] ", 5, 0) is first
+        assert parser.parse_type("list[int]", 2, 0) is first.args[1]
+
+    def test_parse_type_errors_keep_position(self):
+        parser = TypeParser()
+
+        for line in (1, 7):
+            with pytest.raises(TypjaParseError) as exc_info:
+                parser.parse_type("List[str", line, 3)
+            assert exc_info.value.line == line
+
 
 class TestParserImports:
 
@@ -288,6 +343,18 @@ class TestParserImports:
         with pytest.raises(TypjaParseError):
             parser.parse_from_import("from typing", 1, 0)
 
+    def test_parse_from_import_invalid_names(self):
+        parser = ImportParser()
+        for text in ("from typing import List Dict", "from typing import List,", "from typing import (List)"):
+            with pytest.raises(TypjaParseError):
+                parser.parse_from_import(text, 1, 0)
+
+    def test_parse_from_import_alias_whitespace(self):
+        parser = ImportParser()
+        stmt = parser.parse_from_import("from typing import  Dict  as  D ,List", 1, 0)
+
+        assert stmt.names == [("Dict", "D"), ("List", None)]
+
     def test_parse_from_import_no_module(self):
         parser = ImportParser()
         with pytest.raises(TypjaParseError):
@@ -400,6 +467,35 @@ class TestParserComment:
 
         assert isinstance(decl, MacroDeclaration)
 
+    def test_parse_macro_param_metadata(self):
+        parser = CommentParser()
+        comments = parser.parse_template("{# typja:macro card(title: str, body: str, footer: str = None) -> str #}")
+
+        decl = comments[0].declarations[0]
+
+        assert isinstance(decl, MacroDeclaration)
+        assert decl.required_params == ("title", "body")
+        assert decl.param_names == frozenset({"title", "body", "footer"})
+
+    def test_parse_macro_signature_parts(self):
+        parser = CommentParser()
+        comments = parser.parse_template("{# typja:macro row(cb: Callable[[int], str], n: int = 1) -> Literal[')'] #}")
+
+        decl = comments[0].declarations[0]
+
+        assert decl.name == "row"
+        assert [param[0] for param in decl.params] == ["cb", "n"]
+        assert str(decl.return_type) == "Literal[')']"
+
+    def test_parse_macro_invalid(self):
+        parser = CommentParser()
+
+        with pytest.raises(TypjaParseError, match="Invalid macro declaration"):
+            parser.parse_template("{# typja:macro greet -> str #}")
+
+        with pytest.raises(TypjaParseError, match="must specify return type"):
+            parser.parse_template("{# typja:macro greet(name: str) -> #}")
+
     def test_parse_ignore(self):
         parser = CommentParser()
         comments = parser.parse_template("{# typja:ignore #}")
@@ -485,6 +581,12 @@ class TestParserComment:
         with pytest.raises(TypjaParseError):
             parser.parse_template(template)
 
+    def test_parse_template_without_marker(self, monkeypatch):
+        parser = CommentParser()
+        monkeypatch.setattr(CommentParser, "TYPJA_COMMENT_PATTERN", None)
+
+        assert parser.parse_template("<p>{{ name }}</p>{# plain comment #}") == []
+
     def test_parse_with_line_numbers(self):
         parser = CommentParser()
         template = """line 1
@@ -496,6 +598,18 @@ line 3
         assert comments[0].line == 2
         assert comments[1].line == 4
 
+    def test_parse_line_and_col_after_multiline_comment(self):
+        parser = CommentParser()
+        template = """{# typja:var a: int #} {# typja:var b: int #}
+{# typja:var
+   c: int #}
+<p>
+  {# typja:var d: int #}"""
+        comments = parser.parse_template(template)
+
+        assert [c.line for c in comments] == [1, 1, 2, 5]
+        assert [c.col for c in comments] == [1, 24, 1, 3]
+
     def test_parse_complex_generic(self):
         parser = CommentParser()
         comments = parser.parse_template("{# typja:var data: Dict[str, List[int]] #}")
@@ -16,6 +16,13 @@ class TestTypeDefinition:
         assert type_def.fields == {"id": "int", "name": "str"}
         assert type_def.module == "models"
 
+    def test_type_definition_interns_names(self):
+        name, module = "".join(["Us", "er"]), "".join(["mod", "els"])
+        type_def = TypeDefinition(name=name, fields={}, module=module)
+
+        assert type_def.name is TypeAnnotation(raw="User", name="User").name
+        assert type_def.module is TypeAnnotation(raw="models.User", name="User", module="models").module
+
     def test_type_definition_has_field(self):
         type_def = TypeDefinition(name="User", fields={"id": "int", "name": "str"})
 
@@ -110,6 +117,19 @@ class TestTypeRegistry:
         assert "User" in module_types
         assert "Post" in module_types
 
+    def test_reregister_module_types_replaces_qualified_types(self):
+        registry = TypeRegistry()
+
+        user_def = TypeDefinition(name="User", fields={"id": "int"}, module="models")
+        post_def = TypeDefinition(name="Post", fields={"title": "str"}, module="models")
+
+        registry.register_module_types("models", {"User": user_def})
+        registry.register_module_types("models", {"Post": post_def})
+
+        assert registry.resolve_type(TypeAnnotation(raw="models.Post", name="Post", module="models")) is post_def
+        with pytest.raises(TypjaValidationError, match="has no type 'User'"):
+            registry.resolve_type(TypeAnnotation(raw="models.User", name="User", module="models"))
+
     def test_import_module(self):
         registry = TypeRegistry()
 
@@ -123,9 +143,13 @@ class TestTypeRegistry:
     def test_import_nonexistent_module(self):
         registry = TypeRegistry()
 
-        with pytest.raises(TypjaValidationError):
+        with pytest.raises(TypjaValidationError) as exc_info:
             registry.import_module("nonexistent")
 
+        assert exc_info.value.message == "Module 'nonexistent' not found"
+        assert exc_info.value.line == 0
+        assert exc_info.value.col == 0
+
     def test_import_typing_module(self):
         registry = TypeRegistry()
 